@@ -6,11 +6,39 @@ Provides data access for Lesson and LessonAttempt models.
 
 from datetime import datetime, timezone
 
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, and_, desc, func, bindparam
 
 from .base import BaseRepository
 from src.words.models.lesson import Lesson, LessonAttempt
 
+# Statements are built once at import time and reused with bound
+# parameters, so repeated calls skip Select construction and always hit
+# SQLAlchemy's compiled-statement cache.
+_ACTIVE_LESSON_STMT = select(Lesson).where(
+    and_(
+        Lesson.profile_id == bindparam("profile_id"),
+        Lesson.completed_at.is_(None)
+    )
+)
+
+_RECENT_LESSONS_STMT = select(Lesson).where(
+    and_(
+        Lesson.profile_id == bindparam("profile_id"),
+        Lesson.completed_at.is_not(None)
+    )
+).order_by(desc(Lesson.completed_at)).limit(bindparam("limit"))
+
+_LESSONS_COMPLETED_SINCE_STMT = select(func.count(Lesson.lesson_id)).where(
+    and_(
+        Lesson.profile_id == bindparam("profile_id"),
+        Lesson.completed_at >= bindparam("since", type_=Lesson.completed_at.type)
+    )
+)
+
+_LESSON_ATTEMPTS_STMT = select(LessonAttempt).where(
+    LessonAttempt.lesson_id == bindparam("lesson_id")
+).order_by(LessonAttempt.attempted_at, LessonAttempt.attempt_id)
+
 
 class LessonRepository(BaseRepository[Lesson]):
     """Lesson database operations."""
@@ -18,15 +46,19 @@ class LessonRepository(BaseRepository[Lesson]):
     def __init__(self, session):
         super().__init__(session, Lesson)
 
+    async def get_by_id(self, id: int) -> Lesson | None:
+        """Get lesson by ID, served from the identity map when already loaded.
+
+        Lessons are re-read several times per answer within one session, so
+        session.get() saves a SELECT whenever the lesson is already present.
+        """
+        return await self.session.get(Lesson, id)
+
     async def get_active_lesson(self, profile_id: int) -> Lesson | None:
         """Get active (incomplete) lesson for a profile."""
         result = await self.session.execute(
-            select(Lesson).where(
-                and_(
-                    Lesson.profile_id == profile_id,
-                    Lesson.completed_at.is_(None)
-                )
-            )
+            _ACTIVE_LESSON_STMT,
+            {"profile_id": profile_id}
         )
         return result.scalar_one_or_none()
 
@@ -37,12 +69,8 @@ class LessonRepository(BaseRepository[Lesson]):
     ) -> list[Lesson]:
         """Get recent completed lessons."""
         result = await self.session.execute(
-            select(Lesson).where(
-                and_(
-                    Lesson.profile_id == profile_id,
-                    Lesson.completed_at.is_not(None)
-                )
-            ).order_by(desc(Lesson.completed_at)).limit(limit)
+            _RECENT_LESSONS_STMT,
+            {"profile_id": profile_id, "limit": limit}
         )
         return list(result.scalars().all())
 
@@ -53,12 +81,8 @@ class LessonRepository(BaseRepository[Lesson]):
         )
 
         result = await self.session.execute(
-            select(func.count(Lesson.lesson_id)).where(
-                and_(
-                    Lesson.profile_id == profile_id,
-                    Lesson.completed_at >= today_start
-                )
-            )
+            _LESSONS_COMPLETED_SINCE_STMT,
+            {"profile_id": profile_id, "since": today_start}
         )
         return result.scalar_one()
 
@@ -69,14 +93,21 @@ class LessonAttemptRepository(BaseRepository[LessonAttempt]):
     def __init__(self, session):
         super().__init__(session, LessonAttempt)
 
+    def record_attempt(self, attempt: LessonAttempt) -> None:
+        """Stage an attempt for the caller's next flush or commit.
+
+        Unlike add(), this does not flush and refresh, so recording an
+        answer costs no extra round trips when the ID is not needed.
+        """
+        self.session.add(attempt)
+
     async def get_lesson_attempts(
         self,
         lesson_id: int
     ) -> list[LessonAttempt]:
         """Get all attempts for a lesson."""
         result = await self.session.execute(
-            select(LessonAttempt).where(
-                LessonAttempt.lesson_id == lesson_id
-            ).order_by(LessonAttempt.attempted_at)
+            _LESSON_ATTEMPTS_STMT,
+            {"lesson_id": lesson_id}
         )
         return list(result.scalars().all())
@@ -4,11 +4,62 @@ Statistics repository for the Words application.
 Provides data access for WordStatistics model.
 """
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam, case
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from .base import BaseRepository
 from src.words.models.statistics import WordStatistics
 
+# Built once and reused with bound parameters (see repositories/lesson.py).
+_STAT_STMT = select(WordStatistics).where(
+    and_(
+        WordStatistics.user_word_id == bindparam("user_word_id"),
+        WordStatistics.direction == bindparam("direction"),
+        WordStatistics.test_type == bindparam("test_type")
+    )
+)
+
+
+def _build_update_stat_stmt(insert):
+    """Build the single-statement stat upsert for a dialect's INSERT construct.
+
+    The inserted row holds the counters for one attempt; on conflict they
+    are added to the existing row, and a wrong answer resets the streak.
+    """
+    stmt = insert(WordStatistics).values(
+        user_word_id=bindparam("user_word_id"),
+        direction=bindparam("direction"),
+        test_type=bindparam("test_type"),
+        total_attempts=1,
+        correct_count=bindparam("correct"),
+        total_correct=bindparam("correct"),
+        total_errors=bindparam("errors")
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            WordStatistics.user_word_id,
+            WordStatistics.direction,
+            WordStatistics.test_type
+        ],
+        set_={
+            "total_attempts": WordStatistics.total_attempts + 1,
+            "correct_count": case(
+                (stmt.excluded.correct_count == 1, WordStatistics.correct_count + 1),
+                else_=0
+            ),
+            "total_correct": WordStatistics.total_correct + stmt.excluded.total_correct,
+            "total_errors": WordStatistics.total_errors + stmt.excluded.total_errors
+        }
+    ).returning(WordStatistics)
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+_UPDATE_STAT_STMTS = {
+    "sqlite": _build_update_stat_stmt(sqlite_insert),
+    "postgresql": _build_update_stat_stmt(postgresql_insert),
+}
+
 
 class StatisticsRepository(BaseRepository[WordStatistics]):
     """Word statistics operations."""
@@ -24,13 +75,12 @@ class StatisticsRepository(BaseRepository[WordStatistics]):
     ) -> WordStatistics:
         """Get existing stat or create new one."""
         result = await self.session.execute(
-            select(WordStatistics).where(
-                and_(
-                    WordStatistics.user_word_id == user_word_id,
-                    WordStatistics.direction == direction,
-                    WordStatistics.test_type == test_type
-                )
-            )
+            _STAT_STMT,
+            {
+                "user_word_id": user_word_id,
+                "direction": direction,
+                "test_type": test_type
+            }
         )
 
         stat = result.scalar_one_or_none()
@@ -53,7 +103,29 @@ class StatisticsRepository(BaseRepository[WordStatistics]):
         test_type: str,
         is_correct: bool
     ) -> WordStatistics:
-        """Update statistics after an attempt."""
+        """Update statistics after an attempt.
+
+        On SQLite and PostgreSQL this is one upsert round trip; the returned
+        row also refreshes an instance already loaded in the session.
+        Servers without INSERT ... RETURNING (SQLite before 3.35) fall back
+        to read-modify-write.
+        """
+        dialect = self.session.get_bind().dialect
+        upsert = _UPDATE_STAT_STMTS.get(dialect.name) if dialect.insert_returning else None
+        if upsert is not None:
+            result = await self.session.execute(
+                upsert,
+                {
+                    "user_word_id": user_word_id,
+                    "direction": direction,
+                    "test_type": test_type,
+                    "correct": int(is_correct),
+                    "errors": int(not is_correct)
+                },
+                execution_options={"populate_existing": True}
+            )
+            return result.scalar_one()
+
         stat = await self.get_or_create_stat(
             user_word_id, direction, test_type
         )
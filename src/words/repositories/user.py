@@ -6,12 +6,43 @@ This module provides repository classes for:
 - ProfileRepository: Language profile management and active profile switching
 """
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta, timezone
 from .base import BaseRepository
 from src.words.models.user import User, LanguageProfile
 
+# Statements are built once and executed with bound parameters
+# (same approach as repositories/lesson.py), so repeated lookups reuse
+# SQLAlchemy's compiled-statement cache without rebuilding the Select.
+_USER_WITH_PROFILES_STMT = (
+    select(User)
+    .where(User.user_id == bindparam("user_id"))
+    .options(selectinload(User.profiles))
+)
+
+_USERS_FOR_NOTIFICATION_STMT = select(User).where(
+    and_(
+        User.notification_enabled == True,
+        User.last_active_at < bindparam("cutoff", type_=User.last_active_at.type)
+    )
+)
+
+_ACTIVE_PROFILE_STMT = (
+    select(LanguageProfile)
+    .where(
+        and_(
+            LanguageProfile.user_id == bindparam("user_id"),
+            LanguageProfile.is_active == True
+        )
+    )
+    .options(selectinload(LanguageProfile.user))
+)
+
+_USER_PROFILES_STMT = select(LanguageProfile).where(
+    LanguageProfile.user_id == bindparam("user_id")
+)
+
 
 class UserRepository(BaseRepository[User]):
     """User-specific database operations.
@@ -59,9 +90,8 @@ class UserRepository(BaseRepository[User]):
             ...         print(f"Learning {profile.target_language}")
         """
         result = await self.session.execute(
-            select(User)
-            .where(User.user_id == user_id)
-            .options(selectinload(User.profiles))
+            _USER_WITH_PROFILES_STMT,
+            {"user_id": user_id}
         )
         return result.scalar_one_or_none()
 
@@ -92,12 +122,8 @@ class UserRepository(BaseRepository[User]):
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=inactive_hours)
 
         result = await self.session.execute(
-            select(User).where(
-                and_(
-                    User.notification_enabled == True,
-                    User.last_active_at < cutoff_time
-                )
-            )
+            _USERS_FOR_NOTIFICATION_STMT,
+            {"cutoff": cutoff_time}
         )
         return list(result.scalars().all())
 
@@ -170,14 +196,8 @@ class ProfileRepository(BaseRepository[LanguageProfile]):
             ...     print(f"Level: {profile.level.value}")
         """
         result = await self.session.execute(
-            select(LanguageProfile)
-            .where(
-                and_(
-                    LanguageProfile.user_id == user_id,
-                    LanguageProfile.is_active == True
-                )
-            )
-            .options(selectinload(LanguageProfile.user))
+            _ACTIVE_PROFILE_STMT,
+            {"user_id": user_id}
         )
         return result.scalar_one_or_none()
 
@@ -199,9 +219,8 @@ class ProfileRepository(BaseRepository[LanguageProfile]):
             ...     print(f"{p.target_language}: {status}")
         """
         result = await self.session.execute(
-            select(LanguageProfile).where(
-                LanguageProfile.user_id == user_id
-            )
+            _USER_PROFILES_STMT,
+            {"user_id": user_id}
         )
         return list(result.scalars().all())
 
@@ -6,12 +6,73 @@ This module provides repositories for:
 - UserWordRepository: User word management with statistics and relationships
 """
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, bindparam
 from sqlalchemy.orm import selectinload
 from .base import BaseRepository
 from src.words.models.word import Word, UserWord, WordStatusEnum
 from src.words.models.user import LanguageProfile
 
+# Statements are built once and executed with bound parameters
+# (same approach as repositories/lesson.py), so repeated calls skip
+# Select construction and reuse SQLAlchemy's compiled-statement cache.
+_WORD_BY_TEXT_STMT = select(Word).where(
+    and_(
+        Word.word == bindparam("word"),
+        Word.language == bindparam("language")
+    )
+)
+
+_FREQUENCY_WORDS_STMT = select(Word).where(
+    and_(
+        Word.language == bindparam("language"),
+        Word.level == bindparam("level")
+    )
+).order_by(Word.frequency_rank).limit(bindparam("limit"))
+
+_USER_WORD_STMT = select(UserWord).where(
+    and_(
+        UserWord.profile_id == bindparam("profile_id"),
+        UserWord.word_id == bindparam("word_id")
+    )
+).options(
+    selectinload(UserWord.word),
+    selectinload(UserWord.statistics)
+)
+
+_USER_WORD_DETAILS_STMT = select(UserWord).where(
+    UserWord.user_word_id == bindparam("user_word_id")
+).options(
+    selectinload(UserWord.word),
+    selectinload(UserWord.statistics),
+    selectinload(UserWord.profile).selectinload(LanguageProfile.user)
+).execution_options(populate_existing=True)
+
+_LESSON_USER_WORDS_STMT = select(UserWord).where(
+    UserWord.profile_id == bindparam("profile_id")
+).options(
+    selectinload(UserWord.word),
+    selectinload(UserWord.statistics),
+    selectinload(UserWord.profile).selectinload(LanguageProfile.user)
+).limit(bindparam("limit"))
+
+_USER_VOCABULARY_STMT = select(UserWord).where(
+    UserWord.profile_id == bindparam("profile_id")
+).options(
+    selectinload(UserWord.word),
+    selectinload(UserWord.statistics)
+)
+
+_USER_VOCABULARY_BY_STATUS_STMT = _USER_VOCABULARY_STMT.where(
+    UserWord.status == bindparam("status")
+)
+
+_STATUS_COUNTS_STMT = select(
+    UserWord.status,
+    func.count(UserWord.user_word_id)
+).where(
+    UserWord.profile_id == bindparam("profile_id")
+).group_by(UserWord.status)
+
 
 class WordRepository(BaseRepository[Word]):
     """Repository for Word database operations.
@@ -62,12 +123,8 @@ class WordRepository(BaseRepository[Word]):
             return None
 
         result = await self.session.execute(
-            select(Word).where(
-                and_(
-                    Word.word == word.lower(),
-                    Word.language == language
-                )
-            )
+            _WORD_BY_TEXT_STMT,
+            {"word": word.lower(), "language": language}
         )
         return result.scalar_one_or_none()
 
@@ -95,12 +152,8 @@ class WordRepository(BaseRepository[Word]):
             ...     print(f"{word.word}: rank {word.frequency_rank}")
         """
         result = await self.session.execute(
-            select(Word).where(
-                and_(
-                    Word.language == language,
-                    Word.level == level
-                )
-            ).order_by(Word.frequency_rank).limit(limit)
+            _FREQUENCY_WORDS_STMT,
+            {"language": language, "level": level, "limit": limit}
         )
         return list(result.scalars().all())
 
@@ -150,28 +203,16 @@ class UserWordRepository(BaseRepository[UserWord]):
             ...     print(f"Statistics: {len(user_word.statistics)}")
         """
         result = await self.session.execute(
-            select(UserWord).where(
-                and_(
-                    UserWord.profile_id == profile_id,
-                    UserWord.word_id == word_id
-                )
-            ).options(
-                selectinload(UserWord.word),
-                selectinload(UserWord.statistics)
-            )
+            _USER_WORD_STMT,
+            {"profile_id": profile_id, "word_id": word_id}
         )
         return result.scalar_one_or_none()
 
     async def get_by_id_with_details(self, user_word_id: int) -> UserWord | None:
         """Get user word by id with word, statistics, and profile loaded."""
         result = await self.session.execute(
-            select(UserWord).where(
-                UserWord.user_word_id == user_word_id
-            ).options(
-                selectinload(UserWord.word),
-                selectinload(UserWord.statistics),
-                selectinload(UserWord.profile).selectinload(LanguageProfile.user)
-            ).execution_options(populate_existing=True)
+            _USER_WORD_DETAILS_STMT,
+            {"user_word_id": user_word_id}
         )
         return result.scalar_one_or_none()
 
@@ -182,13 +223,8 @@ class UserWordRepository(BaseRepository[UserWord]):
     ) -> list[UserWord]:
         """Get user words for lesson with all required relationships loaded."""
         result = await self.session.execute(
-            select(UserWord).where(
-                UserWord.profile_id == profile_id
-            ).options(
-                selectinload(UserWord.word),
-                selectinload(UserWord.statistics),
-                selectinload(UserWord.profile).selectinload(LanguageProfile.user)
-            ).limit(limit)
+            _LESSON_USER_WORDS_STMT,
+            {"profile_id": profile_id, "limit": limit}
         )
         return list(result.scalars().all())
 
@@ -218,19 +254,16 @@ class UserWordRepository(BaseRepository[UserWord]):
             ...     status=WordStatusEnum.LEARNING
             ... )
         """
-        query = select(UserWord).where(
-            UserWord.profile_id == profile_id
-        )
-
         if status:
-            query = query.where(UserWord.status == status)
-
-        result = await self.session.execute(
-            query.options(
-                selectinload(UserWord.word),
-                selectinload(UserWord.statistics)
+            result = await self.session.execute(
+                _USER_VOCABULARY_BY_STATUS_STMT,
+                {"profile_id": profile_id, "status": status}
+            )
+        else:
+            result = await self.session.execute(
+                _USER_VOCABULARY_STMT,
+                {"profile_id": profile_id}
             )
-        )
         return list(result.scalars().all())
 
     async def count_by_status(
@@ -253,12 +286,8 @@ class UserWordRepository(BaseRepository[UserWord]):
             {'new': 15, 'learning': 23, 'reviewing': 42, 'mastered': 120}
         """
         result = await self.session.execute(
-            select(
-                UserWord.status,
-                func.count(UserWord.user_word_id)
-            ).where(
-                UserWord.profile_id == profile_id
-            ).group_by(UserWord.status)
+            _STATUS_COUNTS_STMT,
+            {"profile_id": profile_id}
         )
 
         return {
@@ -61,7 +61,8 @@ class LessonService:
         user_word_repo: UserWordRepository,
         word_repo: WordRepository,
         stats_repo: StatisticsRepository,
-        validation_service: ValidationService
+        validation_service: ValidationService,
+        rng: random.Random | None = None
     ):
         self.lesson_repo = lesson_repo
         self.attempt_repo = attempt_repo
@@ -69,6 +70,8 @@ class LessonService:
         self.word_repo = word_repo
         self.stats_repo = stats_repo
         self.validation_service = validation_service
+        # Question direction and option order; injectable for deterministic tests
+        self.rng = rng or random
         self.difficulty_adjuster = DifficultyAdjuster(
             choice_to_input_threshold=settings.choice_to_input_threshold,
             mastered_threshold=settings.mastered_threshold
@@ -208,7 +211,7 @@ class LessonService:
             user_word = detailed
 
         test_type = self._determine_test_type(user_word)
-        direction = random.choice([
+        direction = self.rng.choice([
             Direction.NATIVE_TO_FOREIGN.value,
             Direction.FOREIGN_TO_NATIVE.value
         ])
@@ -333,7 +336,7 @@ class LessonService:
             )
             return None
 
-        random.shuffle(options)
+        self.rng.shuffle(options)
         return options[:count]
 
     async def _collect_options_from_language(
@@ -407,7 +410,7 @@ class LessonService:
             validation_method=validation.method
         )
 
-        await self.attempt_repo.add(attempt)
+        self.attempt_repo.record_attempt(attempt)
 
         await self.stats_repo.update_stat(
             user_word_id=question.user_word_id,
@@ -19,7 +19,7 @@ from aiogram import Bot, Dispatcher
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import Message, CallbackQuery, User as TgUser, Chat
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 from src.words.bot.handlers.start import (
     cmd_start,
@@ -31,20 +31,18 @@ from src.words.bot.handlers.start import (
 from src.words.bot.states.registration import RegistrationStates
 from src.words.services.user import UserService
 from src.words.repositories.user import UserRepository, ProfileRepository
-from src.words.models import Base, User, LanguageProfile, CEFRLevel
+from src.words.models import User, LanguageProfile, CEFRLevel
 from src.words.config.constants import SUPPORTED_LANGUAGES
 
 
 @pytest.fixture
-async def test_engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False
-    )
+async def test_engine(integration_engine_factory):
+    """Create in-memory SQLite engine for testing.
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    The database is cloned from the session-wide schema template, so no
+    DDL runs per test.
+    """
+    engine = integration_engine_factory(prewarm=False)
 
     yield engine
 
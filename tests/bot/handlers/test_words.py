@@ -18,7 +18,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, User as TgUser, Chat
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 from src.words.bot.handlers.words import (
     cmd_add_word,
@@ -26,20 +26,18 @@ from src.words.bot.handlers.words import (
     router
 )
 from src.words.bot.states.registration import AddWordStates
-from src.words.models import Base, User, LanguageProfile, CEFRLevel, Word, UserWord
+from src.words.models import User, LanguageProfile, CEFRLevel, Word, UserWord
 from src.words.repositories.user import UserRepository, ProfileRepository
 
 
 @pytest.fixture
-async def test_engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False
-    )
+async def test_engine(integration_engine_factory):
+    """Create in-memory SQLite engine for testing.
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    The database is cloned from the session-wide schema template, so no
+    DDL runs per test.
+    """
+    engine = integration_engine_factory(prewarm=False)
 
     yield engine
 
@@ -9,6 +9,7 @@ import asyncio
 import contextlib
 import pytest_asyncio
 from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 import sys
 import os
 from pathlib import Path
@@ -28,6 +29,36 @@ os.environ.setdefault("DEBUG", "true")
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+# Integration session options never vary between tests, so the factory is
+# built once and bound to each test's connection at checkout time.
+# expire_on_commit=False keeps attributes loaded after commit, avoiding
+# implicit refresh SELECTs (which raise MissingGreenlet in async code).
+_integration_session_factory = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+
+def _run_on_private_loop(coro):
+    """
+    Run a coroutine to completion on a throwaway event loop.
+
+    Unlike asyncio.run(), this leaves the current event loop of a
+    function-scoped caller in place, so synchronous fixtures can set up
+    and dispose engines without disturbing pytest-asyncio's loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Any: The coroutine's result
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
 
 @pytest_asyncio.fixture(autouse=True)
 async def _event_loop_heartbeat():
@@ -90,33 +121,195 @@ def sample_word_data():
 # ================================================================
 
 
-@pytest.fixture
-async def integration_test_engine():
+@pytest.fixture(scope="session")
+def integration_test_template(request):
+    """
+    Build the integration schema once and snapshot it as a template.
+
+    Running Base.metadata.create_all for every test dominates the cost of
+    integration setup. The schema is created a single time in a plain
+    in-memory SQLite database and serialized, so each test database can be
+    cloned from the snapshot instead of re-running the DDL (the SQLite
+    counterpart of CREATE DATABASE ... TEMPLATE).
+
+    When the run is restricted with ``-m stats`` only the tables needed by
+    word statistics tests are created.
+
+    Args:
+        request: pytest request object (used to read the -m option)
+
+    Returns:
+        bytes: Serialized SQLite database containing the schema
+    """
+    import sqlite3
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from src.words.models import (
+        Base, User, LanguageProfile, Word, UserWord, WordStatistics
+    )
+
+    tables = None
+    if request.config.getoption("-m") == "stats":
+        tables = [
+            User.__table__,
+            LanguageProfile.__table__,
+            Word.__table__,
+            UserWord.__table__,
+            WordStatistics.__table__,
+        ]
+
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    engine = create_engine("sqlite://", creator=lambda: template, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=tables)
+
+    snapshot = template.serialize()
+    template.close()
+    return snapshot
+
+
+@pytest.fixture(scope="session")
+def integration_engine_factory(integration_test_template):
+    """
+    Provide a callable that builds in-memory engines from the schema template.
+
+    Engine construction is synchronous, so modules can keep one engine for
+    all of their tests (a plain ``scope="module"`` fixture) without needing
+    a module-scoped event loop. Every engine uses a single connection
+    (StaticPool) holding a private copy of the template database.
+
+    Shared reference rows can be baked into the engine's database with
+    ``seed``: a callable receiving a synchronous Connection inside a
+    transaction. Seeding runs once per engine, so class- or module-scoped
+    engines pay for the INSERTs once instead of once per test.
+
+    By default engines come back with their single connection already
+    open, so the first test of a shared engine does not absorb aiosqlite's
+    thread startup. The warm-up runs on a private event loop and must
+    therefore be requested from synchronous fixtures; function-scoped
+    engines gain nothing from it and pass ``prewarm=False``.
+
+    Args:
+        integration_test_template: Serialized schema from integration_test_template
+
+    Returns:
+        Callable[..., AsyncEngine]: Factory
+            ``(snapshot=None, seed=None, prewarm=True)`` creating a new
+            engine per call, optionally from a different serialized
+            database and/or with seeded rows
+    """
+    import sqlite3
+    import aiosqlite
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    def _clone(snapshot):
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        connection.deserialize(snapshot)
+        # Let SQLAlchemy emit BEGIN itself (see the "begin" listener below);
+        # the sqlite3 module's implicit transactions break SAVEPOINT handling.
+        connection.isolation_level = None
+        return connection
+
+    def _seed(snapshot, seed):
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        connection.deserialize(snapshot)
+        seed_engine = create_engine(
+            "sqlite://", creator=lambda: connection, poolclass=StaticPool
+        )
+        with seed_engine.begin() as conn:
+            seed(conn)
+        seeded = connection.serialize()
+        connection.close()
+        return seeded
+
+    async def _prewarm(engine):
+        # Start the aiosqlite worker thread and clone the database up front;
+        # StaticPool keeps this connection for every later checkout.
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+
+    def _create_engine(snapshot=None, seed=None, prewarm=True):
+        snapshot = snapshot or integration_test_template
+        if seed is not None:
+            snapshot = _seed(snapshot, seed)
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            async_creator=lambda: aiosqlite.Connection(lambda: _clone(snapshot), 64),
+            poolclass=StaticPool,
+            query_cache_size=1024,
+            echo=False
+        )
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        if prewarm:
+            _run_on_private_loop(_prewarm(engine))
+        return engine
+
+    return _create_engine
+
+
+@pytest.fixture(scope="session")
+def seeded_integration_engine(integration_engine_factory):
+    """
+    Provide a context manager building an engine with pre-seeded rows.
+
+    Class- and module-scoped overrides of integration_test_engine use it to
+    write their reference rows once into the engine's database. The engine
+    is disposed on a private loop when the ``with`` block exits, so callers
+    stay plain synchronous fixtures.
+
+    Example:
+        @pytest.fixture(scope="class")
+        def integration_test_engine(self, seeded_integration_engine):
+            with seeded_integration_engine(_seed) as engine:
+                yield engine
+
+    Args:
+        integration_engine_factory: Engine factory from integration_engine_factory
+
+    Returns:
+        Callable[[Callable], ContextManager[AsyncEngine]]: Takes the ``seed``
+            callable passed on to integration_engine_factory
+    """
+    @contextlib.contextmanager
+    def _seeded(seed):
+        engine = integration_engine_factory(seed=seed)
+        try:
+            yield engine
+        finally:
+            _run_on_private_loop(engine.dispose())
+
+    return _seeded
+
+
+@pytest.fixture(scope="session")
+def integration_test_engine(integration_engine_factory):
     """
     Create in-memory async database engine for integration tests.
 
     This fixture creates a real SQLite database with all tables
-    to test actual database operations without mocking.
+    to test actual database operations without mocking. One engine
+    (a private copy of the schema template on a single StaticPool
+    connection) serves the whole test session; isolation between tests
+    comes from the SAVEPOINT rollback in integration_test_session, not
+    from disposing the connection.
+
+    Args:
+        integration_engine_factory: Engine factory from integration_engine_factory
 
     Yields:
         AsyncEngine: SQLAlchemy async engine for testing
     """
-    from sqlalchemy.ext.asyncio import create_async_engine
-    from src.words.models import Base
-
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False
-    )
-
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = integration_engine_factory()
 
     yield engine
 
-    # Cleanup
-    await engine.dispose()
+    # Cleanup - built synchronously, so dispose on a private loop
+    _run_on_private_loop(engine.dispose())
 
 
 @pytest.fixture
@@ -124,22 +317,24 @@ async def integration_test_session(integration_test_engine):
     """
     Create async session for integration tests.
 
+    The session is bound to a connection holding an outer transaction.
+    Commits made by the test (or by code under test) only release
+    savepoints, and the outer transaction is rolled back at teardown.
+
     Args:
         integration_test_engine: AsyncEngine from integration_test_engine fixture
 
     Yields:
         AsyncSession: SQLAlchemy async session for testing
     """
-    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
-
-    async_session = async_sessionmaker(
-        integration_test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        yield session
+    async with integration_test_engine.connect() as connection:
+        transaction = await connection.begin()
+        async with _integration_session_factory(
+            bind=connection,
+            join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await transaction.rollback()
 
 
 # ================================================================
@@ -0,0 +1,216 @@
+"""
+Shared fixtures for repository integration tests.
+
+Exposes the integration engine and SAVEPOINT-isolated session from
+tests/conftest.py as ``engine`` and ``session``, with the word repository
+queries compiled up front. Test classes may override
+``integration_test_engine`` to run against a pre-seeded database.
+Mock-only unit tests get a cheap AsyncSession stand-in from ``stub_session``.
+"""
+
+import asyncio
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _warm_word_statements(engine):
+    """
+    Run each word repository query once so its compiled SQL is cached.
+
+    Runs against empty results inside a transaction that is rolled back.
+    """
+    from src.words.repositories.word import WordRepository, UserWordRepository
+
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+            words = WordRepository(session)
+            user_words = UserWordRepository(session)
+            await words.find_by_text_and_language("warmup", "en")
+            await words.get_frequency_words("en", "A1", limit=1)
+            await user_words.get_user_word(profile_id=0, word_id=0)
+            await user_words.get_by_id_with_details(0)
+            await user_words.get_user_words_for_lesson(0, limit=1)
+            await user_words.get_user_vocabulary(0)
+            await user_words.count_by_status(0)
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def warm_statement_cache():
+    """
+    Provide a callable that pre-compiles the word repository queries.
+
+    SQLAlchemy caches compiled SQL per engine, so each engine the word
+    tests run against is warmed once, when it is built. Engines are built
+    by synchronous fixtures, so the queries run on a private event loop.
+
+    Returns:
+        Callable[[AsyncEngine], None]: Warms one engine's compiled cache
+    """
+    def _warm(engine):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_warm_word_statements(engine))
+        finally:
+            loop.close()
+
+    return _warm
+
+
+@pytest.fixture(scope="session")
+def integration_test_engine(integration_test_engine, warm_statement_cache):
+    """
+    Warm the shared integration engine before repository tests use it.
+
+    Args:
+        integration_test_engine: AsyncEngine from tests/conftest.py
+        warm_statement_cache: Warm-up callable from warm_statement_cache
+
+    Returns:
+        AsyncEngine: The same engine with word repository SQL compiled
+    """
+    warm_statement_cache(integration_test_engine)
+    return integration_test_engine
+
+
+@pytest.fixture
+def engine(integration_test_engine):
+    """
+    Provide the session-wide integration engine under a short name.
+
+    Args:
+        integration_test_engine: AsyncEngine from tests/conftest.py
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine for testing
+    """
+    return integration_test_engine
+
+
+@pytest.fixture
+def session(integration_test_session):
+    """
+    Provide the per-test integration session under a short name.
+
+    Args:
+        integration_test_session: AsyncSession from tests/conftest.py
+
+    Returns:
+        AsyncSession: Session joined to an outer transaction via SAVEPOINTs
+    """
+    return integration_test_session
+
+
+# Statements the SAVEPOINT-isolated session emits on its own; they are
+# never what a query-count assertion is about.
+_TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+@pytest.fixture
+def captured_sql(engine):
+    """
+    Provide a context manager recording the SQL the engine sends inside it.
+
+    Lets integration tests assert on the emitted SQL itself, e.g. that a
+    selectinload issued its secondary ``IN (...)`` query or that an update
+    was a single upsert. Transaction control statements (BEGIN, SAVEPOINT,
+    RELEASE, ...) are not recorded.
+
+    Example:
+        with captured_sql() as statements:
+            await repo.get_user_word(profile_id, word_id)
+        assert len(statements) == 3
+
+    Args:
+        engine: AsyncEngine from the engine fixture
+
+    Returns:
+        Callable[..., ContextManager[list]]: ``captured_sql(parameters=False)``
+            yielding the statements executed in the block, as
+            ``(statement, parameters)`` pairs when ``parameters`` is true
+    """
+    @contextmanager
+    def _capture(parameters=False):
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, params, context, executemany):
+            if statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+                return
+            statements.append((statement, params) if parameters else statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _capture
+
+
+class _FakeResult:
+    """Minimal stand-in for an SQLAlchemy Result returned by a mocked execute()."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class _StubSession:
+    """
+    Cheap stand-in for AsyncSession in mock-only unit tests.
+
+    Exposes only the session methods the repositories call, avoiding the
+    spec introspection AsyncMock(spec=AsyncSession) performs per instance.
+    All methods are attached to one parent mock, so ``mock_calls`` records
+    the full, ordered sequence of session calls.
+    """
+
+    def __init__(self):
+        self._calls = MagicMock()
+        for name in ("execute", "flush", "commit", "rollback", "refresh", "delete"):
+            child = AsyncMock()
+            self._calls.attach_mock(child, name)
+            setattr(self, name, child)
+        self.add = MagicMock()
+        self._calls.attach_mock(self.add, "add")
+
+    @property
+    def mock_calls(self):
+        return self._calls.mock_calls
+
+    def returns(self, rows=()):
+        """Make ``execute()`` return a prebuilt result over ``rows``."""
+        self.execute.return_value = _FakeResult(rows)
+
+    def returns_one(self, row):
+        """Make ``execute()`` return a single-row result, or an empty one for None."""
+        self.returns(() if row is None else (row,))
+
+
+@pytest.fixture
+def stub_session():
+    """
+    Provide a fresh session stub for mock-only repository tests.
+
+    Returns:
+        _StubSession: Stub with async execute/flush/commit/rollback/refresh/delete
+            whose ``execute()`` results are set with ``returns(rows)`` or
+            ``returns_one(row)``
+    """
+    return _StubSession()
+
@@ -11,8 +11,8 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from unittest.mock import AsyncMock, NonCallableMagicMock, patch, PropertyMock
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, Column, Integer, String
 from sqlalchemy.orm import DeclarativeBase
 
@@ -42,6 +42,13 @@ class CustomPKModel(Base):
     data = Column(String(100))
 
 
+def _mk_result(**chain) -> NonCallableMagicMock:
+    """Build a mocked execute() result with its return-value chain pre-wired."""
+    result = NonCallableMagicMock()
+    result.configure_mock(**chain)
+    return result
+
+
 class TestBaseRepositoryInitialization:
     """Tests for BaseRepository initialization."""
 
@@ -70,10 +77,8 @@ class TestGetById:
     async def test_get_by_id_returns_entity_when_found(self):
         """Test that get_by_id returns entity when it exists."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
         mock_entity = TestModel(id=1, name="test")
-        mock_result.scalar_one_or_none.return_value = mock_entity
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalar_one_or_none.return_value": mock_entity})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_by_id(1)
@@ -85,9 +90,7 @@ class TestGetById:
     async def test_get_by_id_returns_none_when_not_found(self):
         """Test that get_by_id returns None when entity doesn't exist."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalar_one_or_none.return_value": None})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_by_id(999)
@@ -98,10 +101,8 @@ class TestGetById:
     async def test_get_by_id_with_custom_pk_name(self):
         """Test that get_by_id works with models that have custom primary key names."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
         mock_entity = CustomPKModel(custom_id=1, data="test")
-        mock_result.scalar_one_or_none.return_value = mock_entity
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalar_one_or_none.return_value": mock_entity})
 
         repo = BaseRepository(mock_session, CustomPKModel)
         result = await repo.get_by_id(1)
@@ -116,16 +117,12 @@ class TestGetAll:
     async def test_get_all_returns_list_of_entities(self):
         """Test that get_all returns list of entities."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
         entities = [
             TestModel(id=1, name="test1"),
             TestModel(id=2, name="test2"),
             TestModel(id=3, name="test3")
         ]
-        mock_scalars.all.return_value = entities
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": entities})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_all()
@@ -137,12 +134,8 @@ class TestGetAll:
     async def test_get_all_with_custom_limit(self):
         """Test that get_all respects custom limit parameter."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
         entities = [TestModel(id=1, name="test1"), TestModel(id=2, name="test2")]
-        mock_scalars.all.return_value = entities
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": entities})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_all(limit=2)
@@ -153,12 +146,8 @@ class TestGetAll:
     async def test_get_all_with_offset(self):
         """Test that get_all respects offset parameter for pagination."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
         entities = [TestModel(id=3, name="test3"), TestModel(id=4, name="test4")]
-        mock_scalars.all.return_value = entities
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": entities})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_all(limit=2, offset=2)
@@ -169,11 +158,7 @@ class TestGetAll:
     async def test_get_all_returns_empty_list_when_no_entities(self):
         """Test that get_all returns empty list when no entities exist."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": []})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_all()
@@ -184,11 +169,7 @@ class TestGetAll:
     async def test_get_all_default_limit_is_100(self):
         """Test that get_all uses default limit of 100."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": []})
 
         repo = BaseRepository(mock_session, TestModel)
         await repo.get_all()
@@ -290,33 +271,17 @@ class TestBaseRepositoryIntegration:
     that the repository works correctly with real SQLAlchemy sessions.
     """
 
-    @pytest.fixture
-    async def engine(self):
-        """Create async engine for testing."""
-        engine = create_async_engine(
-            "sqlite+aiosqlite:///:memory:",
-            echo=False
-        )
-
-        # Create tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        yield engine
-
-        await engine.dispose()
-
-    @pytest.fixture
-    async def session(self, engine):
-        """Create async session for testing."""
-        async_session = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+    @pytest.fixture(scope="class")
+    def integration_test_engine(self, seeded_integration_engine):
+        """
+        Create one engine whose database also holds this module's test tables.
 
-        async with async_session() as session:
-            yield session
+        The tables are created once, on the snapshot every connection is
+        cloned from; the ``session`` fixture rolls back each test's writes,
+        so the engine is disposed only after the last test in the class.
+        """
+        with seeded_integration_engine(Base.metadata.create_all) as engine:
+            yield engine
 
     @pytest.mark.asyncio
     async def test_integration_add_and_get_by_id(self, session):
@@ -435,9 +400,7 @@ class TestBaseRepositoryEdgeCases:
     async def test_get_by_id_with_zero(self):
         """Test get_by_id with ID 0 (edge case for some databases)."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalar_one_or_none.return_value": None})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_by_id(0)
@@ -449,11 +412,7 @@ class TestBaseRepositoryEdgeCases:
     async def test_get_all_with_zero_limit(self):
         """Test get_all with limit=0."""
         mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = _mk_result(**{"scalars.return_value.all.return_value": []})
 
         repo = BaseRepository(mock_session, TestModel)
         result = await repo.get_all(limit=0)
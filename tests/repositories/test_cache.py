@@ -14,12 +14,11 @@ Tests cover:
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from src.words.repositories.cache import CacheRepository
 from src.words.models.cache import CachedTranslation, CachedValidation
-from src.words.models.base import Base
 from src.words.models.word import Word
 
 
@@ -435,34 +434,6 @@ class TestSetValidation:
 class TestCacheRepositoryIntegration:
     """Integration tests with real database."""
 
-    @pytest.fixture
-    async def engine(self):
-        """Create async engine for testing."""
-        engine = create_async_engine(
-            "sqlite+aiosqlite:///:memory:",
-            echo=False
-        )
-
-        # Create tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        yield engine
-
-        await engine.dispose()
-
-    @pytest.fixture
-    async def session(self, engine):
-        """Create async session for testing."""
-        async_session = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
-
-        async with async_session() as session:
-            yield session
-
     @pytest.mark.asyncio
     async def test_integration_translation_cache_miss(self, session):
         """Test translation cache miss returns None."""
@@ -7,6 +7,8 @@ These tests exercise real DB reads/writes and repository queries.
 import pytest
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import insert
+
 from src.words.repositories.lesson import LessonRepository, LessonAttemptRepository
 from src.words.repositories.statistics import StatisticsRepository
 from src.words.models import (
@@ -20,83 +22,130 @@ from src.words.models import (
 )
 
 
+async def _seed_profile(session, user_id: int, words: tuple[str, ...] = ()) -> int:
+    """
+    Insert a user, its profile and optional user words with Core inserts.
+
+    Setup rows are never modified by the tests, so they skip ORM construction
+    and identity-map tracking. Primary keys are assigned explicitly: the
+    profile reuses user_id, and words/user words are numbered from 1.
+
+    Returns:
+        int: profile_id of the inserted profile
+    """
+    await session.execute(
+        insert(User).values(user_id=user_id, native_language="ru", interface_language="ru")
+    )
+    await session.execute(
+        insert(LanguageProfile).values(
+            profile_id=user_id,
+            user_id=user_id,
+            target_language="en",
+            level=CEFRLevel.B1
+        )
+    )
+    if words:
+        await session.execute(
+            insert(Word),
+            [
+                {"word_id": word_id, "word": text, "language": "en"}
+                for word_id, text in enumerate(words, start=1)
+            ]
+        )
+        await session.execute(
+            insert(UserWord),
+            [
+                {"user_word_id": word_id, "profile_id": user_id, "word_id": word_id}
+                for word_id in range(1, len(words) + 1)
+            ]
+        )
+    await session.commit()
+    return user_id
+
+
+def _stat_counters(stat) -> dict[str, int]:
+    """Collect WordStatistics counters into a dict for a single comparison."""
+    return {
+        name: getattr(stat, name)
+        for name in ("total_attempts", "correct_count", "total_correct", "total_errors")
+    }
+
+
 @pytest.mark.asyncio
 async def test_lesson_repository_queries(integration_test_session):
     session = integration_test_session
     lesson_repo = LessonRepository(session)
 
-    user = User(user_id=20001, native_language="ru", interface_language="ru")
-    profile = LanguageProfile(user_id=20001, target_language="en", level=CEFRLevel.B1)
-    session.add_all([user, profile])
-    await session.commit()
+    profile_id = await _seed_profile(session, 20001)
 
     now = datetime.now(timezone.utc)
-    active_lesson = Lesson(profile_id=profile.profile_id, words_count=1)
+    active_lesson = Lesson(profile_id=profile_id, words_count=1)
     recent_lesson = Lesson(
-        profile_id=profile.profile_id,
+        profile_id=profile_id,
         words_count=1,
         completed_at=now - timedelta(minutes=10)
     )
     old_lesson = Lesson(
-        profile_id=profile.profile_id,
+        profile_id=profile_id,
         words_count=1,
         completed_at=now - timedelta(days=1)
     )
     session.add_all([active_lesson, recent_lesson, old_lesson])
     await session.commit()
 
-    active = await lesson_repo.get_active_lesson(profile.profile_id)
+    active = await lesson_repo.get_active_lesson(profile_id)
     assert active is not None
     assert active.completed_at is None
 
-    recent = await lesson_repo.get_recent_lessons(profile.profile_id, limit=1)
+    recent = await lesson_repo.get_recent_lessons(profile_id, limit=1)
     assert len(recent) == 1
     assert recent[0].completed_at == recent_lesson.completed_at
 
-    count_today = await lesson_repo.count_lessons_today(profile.profile_id)
+    count_today = await lesson_repo.count_lessons_today(profile_id)
     assert count_today == 1
 
+    # Loaded lessons come back from the identity map
+    assert await lesson_repo.get_by_id(active_lesson.lesson_id) is active_lesson
+    assert await lesson_repo.get_by_id(-1) is None
+
 
+@pytest.mark.stats
 @pytest.mark.asyncio
 async def test_statistics_repository_updates(integration_test_session):
     session = integration_test_session
     stats_repo = StatisticsRepository(session)
 
-    user = User(user_id=20002, native_language="ru", interface_language="ru")
-    profile = LanguageProfile(user_id=20002, target_language="en", level=CEFRLevel.B1)
-    word = Word(word="house", language="en")
-    session.add_all([user, profile, word])
-    await session.commit()
-
-    user_word = UserWord(profile_id=profile.profile_id, word_id=word.word_id)
-    session.add(user_word)
-    await session.commit()
+    await _seed_profile(session, 20002, words=("house",))
+    user_word_id = 1
 
     stat = await stats_repo.update_stat(
-        user_word_id=user_word.user_word_id,
+        user_word_id=user_word_id,
         direction="native_to_foreign",
         test_type="multiple_choice",
         is_correct=True
     )
-    await session.commit()
 
-    assert stat.total_attempts == 1
-    assert stat.correct_count == 1
-    assert stat.total_correct == 1
-    assert stat.total_errors == 0
+    assert _stat_counters(stat) == {
+        "total_attempts": 1,
+        "correct_count": 1,
+        "total_correct": 1,
+        "total_errors": 0,
+    }
 
     stat = await stats_repo.update_stat(
-        user_word_id=user_word.user_word_id,
+        user_word_id=user_word_id,
         direction="native_to_foreign",
         test_type="multiple_choice",
         is_correct=False
     )
     await session.commit()
 
-    assert stat.total_attempts == 2
-    assert stat.correct_count == 0
-    assert stat.total_correct == 1
-    assert stat.total_errors == 1
+    assert _stat_counters(stat) == {
+        "total_attempts": 2,
+        "correct_count": 0,
+        "total_correct": 1,
+        "total_errors": 1,
+    }
 
 
 @pytest.mark.asyncio
@@ -104,37 +153,120 @@ async def test_lesson_attempt_repository_ordering(integration_test_session):
     session = integration_test_session
     attempt_repo = LessonAttemptRepository(session)
 
-    user = User(user_id=20003, native_language="ru", interface_language="ru")
-    profile = LanguageProfile(user_id=20003, target_language="en", level=CEFRLevel.B1)
-    word = Word(word="cat", language="en")
-    session.add_all([user, profile, word])
-    await session.commit()
+    profile_id = await _seed_profile(session, 20003, words=("cat",))
+    user_word_id = 1
 
-    user_word = UserWord(profile_id=profile.profile_id, word_id=word.word_id)
-    lesson = Lesson(profile_id=profile.profile_id, words_count=2)
-    session.add_all([user_word, lesson])
+    lesson = Lesson(profile_id=profile_id, words_count=2)
+    session.add(lesson)
     await session.commit()
 
-    attempt1 = LessonAttempt(
-        lesson_id=lesson.lesson_id,
-        user_word_id=user_word.user_word_id,
-        direction="native_to_foreign",
-        test_type="multiple_choice",
-        user_answer="cat",
-        correct_answer="cat",
-        is_correct=True
+    shared_row = {
+        "lesson_id": lesson.lesson_id,
+        "user_word_id": user_word_id,
+        "direction": "native_to_foreign",
+        "test_type": "multiple_choice",
+        "user_answer": "cat",
+        "correct_answer": "cat",
+        "is_correct": True
+    }
+    result = await session.execute(
+        insert(LessonAttempt).returning(
+            LessonAttempt.attempt_id, sort_by_parameter_order=True
+        ),
+        [shared_row, shared_row]
     )
-    attempt2 = LessonAttempt(
+    expected_ids = [row[0] for row in result]
+    await session.commit()
+
+    attempts = await attempt_repo.get_lesson_attempts(lesson.lesson_id)
+    assert [a.attempt_id for a in attempts] == expected_ids
+
+
+@pytest.mark.asyncio
+async def test_lesson_attempt_repository_record_attempt_defers_flush(integration_test_session):
+    session = integration_test_session
+    attempt_repo = LessonAttemptRepository(session)
+
+    profile_id = await _seed_profile(session, 20004, words=("dog",))
+
+    lesson = Lesson(profile_id=profile_id, words_count=1)
+    session.add(lesson)
+    await session.commit()
+
+    attempt = LessonAttempt(
         lesson_id=lesson.lesson_id,
-        user_word_id=user_word.user_word_id,
+        user_word_id=1,
         direction="native_to_foreign",
         test_type="multiple_choice",
-        user_answer="cat",
-        correct_answer="cat",
+        user_answer="dog",
+        correct_answer="dog",
         is_correct=True
     )
-    session.add_all([attempt1, attempt2])
-    await session.commit()
+    attempt_repo.record_attempt(attempt)
+
+    assert attempt in session.new
+    assert attempt.attempt_id is None
 
     attempts = await attempt_repo.get_lesson_attempts(lesson.lesson_id)
-    assert [a.attempt_id for a in attempts] == sorted(a.attempt_id for a in attempts)
+    assert attempts == [attempt]
+    assert attempt.attempt_id is not None
+
+
+@pytest.mark.stats
+@pytest.mark.asyncio
+async def test_statistics_repository_update_is_single_upsert(integration_test_session, captured_sql):
+    session = integration_test_session
+    stats_repo = StatisticsRepository(session)
+
+    await _seed_profile(session, 20006, words=("tree",))
+    await session.flush()
+
+    with captured_sql() as statements:
+        for is_correct in (True, True, False):
+            stat = await stats_repo.update_stat(
+                user_word_id=1,
+                direction="native_to_foreign",
+                test_type="multiple_choice",
+                is_correct=is_correct
+            )
+
+    assert len(statements) == 3
+    assert all("ON CONFLICT" in statement for statement in statements)
+    assert _stat_counters(stat) == {
+        "total_attempts": 3,
+        "correct_count": 0,
+        "total_correct": 2,
+        "total_errors": 1,
+    }
+
+
+@pytest.mark.stats
+@pytest.mark.asyncio
+async def test_statistics_repository_update_falls_back_without_returning(
+    integration_test_session, captured_sql, monkeypatch
+):
+    session = integration_test_session
+    stats_repo = StatisticsRepository(session)
+
+    await _seed_profile(session, 20007, words=("leaf",))
+    await session.flush()
+
+    # SQLAlchemy turns insert_returning off for SQLite older than 3.35
+    monkeypatch.setattr(session.get_bind().dialect, "insert_returning", False)
+
+    with captured_sql() as statements:
+        for is_correct in (True, True, False):
+            stat = await stats_repo.update_stat(
+                user_word_id=1,
+                direction="native_to_foreign",
+                test_type="multiple_choice",
+                is_correct=is_correct
+            )
+
+    assert not any("ON CONFLICT" in statement for statement in statements)
+    assert _stat_counters(stat) == {
+        "total_attempts": 3,
+        "correct_count": 0,
+        "total_correct": 2,
+        "total_errors": 1,
+    }
@@ -10,66 +10,111 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock, ANY, call
 from datetime import datetime, timedelta, timezone
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy import select
 
 from src.words.repositories.user import UserRepository, ProfileRepository
-from src.words.models import Base, User, LanguageProfile, CEFRLevel
+from src.words.models import User, LanguageProfile, CEFRLevel
+
+
+# Fixed "long ago" activity timestamp for mock-session tests
+_FIXED_OLD = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _mk_user(**fields) -> MagicMock:
+    """Build a lightweight User stand-in for mock-session unit tests."""
+    return MagicMock(spec=User, **fields)
+
+
+def _mk_profile(**fields) -> MagicMock:
+    """Build a lightweight LanguageProfile stand-in for mock-session unit tests."""
+    return MagicMock(spec=LanguageProfile, **fields)
 
 
 class TestUserRepositoryInitialization:
     """Tests for UserRepository initialization."""
 
-    @pytest.mark.asyncio
-    async def test_user_repository_initialization(self):
+    def test_user_repository_initialization(self, stub_session):
         """Test that UserRepository can be initialized with session."""
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = stub_session
         repo = UserRepository(mock_session)
 
         assert repo.session is mock_session
         assert repo.model is User
 
 
-class TestGetByTelegramId:
-    """Tests for get_by_telegram_id method."""
+# (repository class, method, user_id, row factory or None for "not found")
+_SINGLE_ROW_LOOKUP_CASES = [
+    (
+        UserRepository, "get_by_telegram_id", 123456789,
+        lambda: _mk_user(user_id=123456789, native_language="ru", interface_language="ru")
+    ),
+    (UserRepository, "get_by_telegram_id", 999999999, None),
+    (
+        ProfileRepository, "get_active_profile", 123456789,
+        lambda: _mk_profile(
+            user_id=123456789, target_language="en", level=CEFRLevel.B1, is_active=True
+        )
+    ),
+    (ProfileRepository, "get_active_profile", 123456789, None),
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Expand ``repo_case`` into the single-row lookup cases."""
+    if "repo_case" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "repo_case",
+            _SINGLE_ROW_LOOKUP_CASES,
+            ids=[
+                f"{method}-{'found' if make_row else 'missing'}"
+                for _, method, _, make_row in _SINGLE_ROW_LOOKUP_CASES
+            ]
+        )
+
+
+class TestSingleRowLookups:
+    """Found / not-found behaviour shared by single-row repository lookups."""
 
     @pytest.mark.asyncio
-    async def test_get_by_telegram_id_returns_user_when_found(self):
-        """Test that get_by_telegram_id returns user when it exists."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_user = User(user_id=123456789, native_language="ru", interface_language="ru")
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
+    async def test_repo_method(self, stub_session, repo_case):
+        """Test that the lookup returns the stored row, or None when missing."""
+        repo_class, method, user_id, make_row = repo_case
+        mock_session = stub_session
+        row = make_row() if make_row else None
+        mock_session.returns_one(row)
 
-        repo = UserRepository(mock_session)
-        result = await repo.get_by_telegram_id(123456789)
+        repo = repo_class(mock_session)
+        result = await getattr(repo, method)(user_id)
 
-        assert result is mock_user
+        assert result is row
         mock_session.execute.assert_called_once()
 
+
+class TestGetByTelegramId:
+    """Tests for get_by_telegram_id method."""
+
     @pytest.mark.asyncio
-    async def test_get_by_telegram_id_returns_none_when_not_found(self):
-        """Test that get_by_telegram_id returns None when user doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+    async def test_get_by_telegram_id_reuses_statement_across_calls(self, stub_session):
+        """Test that get_by_telegram_id executes one prebuilt statement with bound user_id."""
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = UserRepository(mock_session)
-        result = await repo.get_by_telegram_id(999999999)
+        await repo.get_by_telegram_id(111)
+        await repo.get_by_telegram_id(222)
 
-        assert result is None
+        first, second = mock_session.execute.call_args_list
+        assert first.args[0] is second.args[0]
+        assert first.args[1] == {"user_id": 111}
+        assert second.args[1] == {"user_id": 222}
 
     @pytest.mark.asyncio
-    async def test_get_by_telegram_id_uses_selectinload_for_profiles(self):
+    async def test_get_by_telegram_id_uses_selectinload_for_profiles(self, stub_session):
         """Test that get_by_telegram_id uses selectinload to eagerly load profiles."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = UserRepository(mock_session)
         await repo.get_by_telegram_id(123456789)
@@ -82,20 +127,16 @@ class TestGetUsersForNotification:
     """Tests for get_users_for_notification method."""
 
     @pytest.mark.asyncio
-    async def test_get_users_for_notification_returns_inactive_users(self):
+    async def test_get_users_for_notification_returns_inactive_users(self, stub_session):
         """Test that get_users_for_notification returns users needing notification."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         # Create mock users with old last_active_at
         users = [
-            User(user_id=100, native_language="ru", interface_language="ru", notification_enabled=True),
-            User(user_id=200, native_language="en", interface_language="en", notification_enabled=True)
+            _mk_user(user_id=100, native_language="ru", interface_language="ru", notification_enabled=True),
+            _mk_user(user_id=200, native_language="en", interface_language="en", notification_enabled=True)
         ]
-        mock_scalars.all.return_value = users
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(users)
 
         repo = UserRepository(mock_session)
         result = await repo.get_users_for_notification(inactive_hours=24, current_hour=10)
@@ -105,29 +146,10 @@ class TestGetUsersForNotification:
         assert result[1].user_id == 200
 
     @pytest.mark.asyncio
-    async def test_get_users_for_notification_returns_empty_list_when_no_users(self):
-        """Test that get_users_for_notification returns empty list when no users match."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = UserRepository(mock_session)
-        result = await repo.get_users_for_notification(inactive_hours=24, current_hour=10)
-
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_get_users_for_notification_filters_by_inactive_hours(self):
+    async def test_get_users_for_notification_filters_by_inactive_hours(self, stub_session):
         """Test that get_users_for_notification filters by inactive hours."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns([])
 
         repo = UserRepository(mock_session)
         await repo.get_users_for_notification(inactive_hours=48, current_hour=14)
@@ -140,51 +162,45 @@ class TestUpdateLastActive:
     """Tests for update_last_active method."""
 
     @pytest.mark.asyncio
-    async def test_update_last_active_updates_timestamp(self):
+    async def test_update_last_active_updates_timestamp(self, stub_session):
         """Test that update_last_active updates the last_active_at field."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
+        mock_session = stub_session
 
         # Create mock user
-        mock_user = User(
+        mock_user = _mk_user(
             user_id=123456789,
             native_language="ru",
             interface_language="ru",
-            last_active_at=datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+            last_active_at=_FIXED_OLD
         )
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
+        mock_session.returns_one(mock_user)
 
         repo = UserRepository(mock_session)
         await repo.update_last_active(123456789)
 
         # Verify last_active_at was updated
-        assert mock_user.last_active_at > datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
-        mock_session.flush.assert_called_once()
+        assert mock_user.last_active_at > _FIXED_OLD
+        assert mock_session.mock_calls == [call.execute(ANY, ANY), call.flush()]
 
     @pytest.mark.asyncio
-    async def test_update_last_active_does_nothing_when_user_not_found(self):
+    async def test_update_last_active_does_nothing_when_user_not_found(self, stub_session):
         """Test that update_last_active does nothing when user doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = UserRepository(mock_session)
         await repo.update_last_active(999999999)
 
-        # Verify flush was not called
-        mock_session.flush.assert_not_called()
+        # Only the lookup ran - no flush
+        assert mock_session.mock_calls == [call.execute(ANY, ANY)]
 
     @pytest.mark.asyncio
-    async def test_update_last_active_sets_timezone_aware_datetime(self):
+    async def test_update_last_active_sets_timezone_aware_datetime(self, stub_session):
         """Test that update_last_active sets timezone-aware datetime."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
+        mock_session = stub_session
 
-        mock_user = User(user_id=123456789, native_language="ru", interface_language="ru")
-        mock_result.scalar_one_or_none.return_value = mock_user
-        mock_session.execute.return_value = mock_result
+        mock_user = _mk_user(user_id=123456789, native_language="ru", interface_language="ru")
+        mock_session.returns_one(mock_user)
 
         repo = UserRepository(mock_session)
         await repo.update_last_active(123456789)
@@ -198,72 +214,29 @@ class TestUpdateLastActive:
 class TestProfileRepositoryInitialization:
     """Tests for ProfileRepository initialization."""
 
-    @pytest.mark.asyncio
-    async def test_profile_repository_initialization(self):
+    def test_profile_repository_initialization(self, stub_session):
         """Test that ProfileRepository can be initialized with session."""
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = stub_session
         repo = ProfileRepository(mock_session)
 
         assert repo.session is mock_session
         assert repo.model is LanguageProfile
 
 
-class TestGetActiveProfile:
-    """Tests for get_active_profile method."""
-
-    @pytest.mark.asyncio
-    async def test_get_active_profile_returns_active_profile(self):
-        """Test that get_active_profile returns the active profile."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-
-        mock_profile = LanguageProfile(
-            user_id=123456789,
-            target_language="en",
-            level=CEFRLevel.B1,
-            is_active=True
-        )
-        mock_result.scalar_one_or_none.return_value = mock_profile
-        mock_session.execute.return_value = mock_result
-
-        repo = ProfileRepository(mock_session)
-        result = await repo.get_active_profile(123456789)
-
-        assert result is mock_profile
-        assert result.is_active is True
-
-    @pytest.mark.asyncio
-    async def test_get_active_profile_returns_none_when_no_active_profile(self):
-        """Test that get_active_profile returns None when no active profile exists."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-
-        repo = ProfileRepository(mock_session)
-        result = await repo.get_active_profile(123456789)
-
-        assert result is None
-
-
 class TestGetUserProfiles:
     """Tests for get_user_profiles method."""
 
     @pytest.mark.asyncio
-    async def test_get_user_profiles_returns_all_profiles(self):
+    async def test_get_user_profiles_returns_all_profiles(self, stub_session):
         """Test that get_user_profiles returns all profiles for a user."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         profiles = [
-            LanguageProfile(user_id=123456789, target_language="en", level=CEFRLevel.B1, is_active=True),
-            LanguageProfile(user_id=123456789, target_language="es", level=CEFRLevel.A2, is_active=False),
-            LanguageProfile(user_id=123456789, target_language="de", level=CEFRLevel.B2, is_active=False)
+            _mk_profile(user_id=123456789, target_language="en", level=CEFRLevel.B1, is_active=True),
+            _mk_profile(user_id=123456789, target_language="es", level=CEFRLevel.A2, is_active=False),
+            _mk_profile(user_id=123456789, target_language="de", level=CEFRLevel.B2, is_active=False)
         ]
-        mock_scalars.all.return_value = profiles
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(profiles)
 
         repo = ProfileRepository(mock_session)
         result = await repo.get_user_profiles(123456789)
@@ -273,41 +246,24 @@ class TestGetUserProfiles:
         assert result[1].target_language == "es"
         assert result[2].target_language == "de"
 
-    @pytest.mark.asyncio
-    async def test_get_user_profiles_returns_empty_list_when_no_profiles(self):
-        """Test that get_user_profiles returns empty list when user has no profiles."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = ProfileRepository(mock_session)
-        result = await repo.get_user_profiles(123456789)
-
-        assert result == []
-
 
 class TestSwitchActiveLanguage:
     """Tests for switch_active_language method."""
 
     @pytest.mark.asyncio
-    async def test_switch_active_language_deactivates_all_and_activates_target(self):
+    async def test_switch_active_language_deactivates_all_and_activates_target(self, stub_session):
         """Test that switch_active_language correctly switches active profile."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         # Create mock profiles
-        profile_en = LanguageProfile(
+        profile_en = _mk_profile(
             profile_id=1,
             user_id=123456789,
             target_language="en",
             level=CEFRLevel.B1,
             is_active=True
         )
-        profile_es = LanguageProfile(
+        profile_es = _mk_profile(
             profile_id=2,
             user_id=123456789,
             target_language="es",
@@ -316,9 +272,7 @@ class TestSwitchActiveLanguage:
         )
         profiles = [profile_en, profile_es]
 
-        mock_scalars.all.return_value = profiles
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(profiles)
 
         repo = ProfileRepository(mock_session)
         result = await repo.switch_active_language(123456789, "es")
@@ -329,23 +283,25 @@ class TestSwitchActiveLanguage:
         assert profile_es.is_active is True
         # Verify the activated profile was returned
         assert result is profile_es
-        # Flush is called twice: once in deactivate_all_profiles, once in switch_active_language
-        assert mock_session.flush.call_count == 2
+        # deactivate_all_profiles loads and flushes, then switch_active_language
+        # reloads the profiles and flushes the activation
+        assert mock_session.mock_calls == [
+            call.execute(ANY, ANY),
+            call.flush(),
+            call.execute(ANY, ANY),
+            call.flush(),
+        ]
 
     @pytest.mark.asyncio
-    async def test_switch_active_language_raises_error_when_language_not_found(self):
+    async def test_switch_active_language_raises_error_when_language_not_found(self, stub_session):
         """Test that switch_active_language raises ValueError when language doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         # Create mock profiles without the target language
         profiles = [
-            LanguageProfile(user_id=123456789, target_language="en", level=CEFRLevel.B1, is_active=True)
+            _mk_profile(user_id=123456789, target_language="en", level=CEFRLevel.B1, is_active=True)
         ]
-        mock_scalars.all.return_value = profiles
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(profiles)
 
         repo = ProfileRepository(mock_session)
 
@@ -356,20 +312,18 @@ class TestSwitchActiveLanguage:
         assert "fr" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_switch_active_language_handles_no_active_profile(self):
+    async def test_switch_active_language_handles_no_active_profile(self, stub_session):
         """Test that switch_active_language works when no profile is currently active."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         # Create mock profiles with none active
-        profile_en = LanguageProfile(
+        profile_en = _mk_profile(
             user_id=123456789,
             target_language="en",
             level=CEFRLevel.B1,
             is_active=False
         )
-        profile_es = LanguageProfile(
+        profile_es = _mk_profile(
             user_id=123456789,
             target_language="es",
             level=CEFRLevel.A2,
@@ -377,9 +331,7 @@ class TestSwitchActiveLanguage:
         )
         profiles = [profile_en, profile_es]
 
-        mock_scalars.all.return_value = profiles
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(profiles)
 
         repo = ProfileRepository(mock_session)
         result = await repo.switch_active_language(123456789, "es")
@@ -389,44 +341,15 @@ class TestSwitchActiveLanguage:
         assert result is profile_es
 
 
+@pytest.mark.xdist_group(name="user_repo_integration")
 class TestUserRepositoryIntegration:
     """Integration tests for UserRepository with actual database."""
 
-    @pytest.fixture
-    async def engine(self):
-        """Create async engine for testing."""
-        engine = create_async_engine(
-            "sqlite+aiosqlite:///:memory:",
-            echo=False
-        )
-
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        yield engine
-
-        await engine.dispose()
-
-    @pytest.fixture
-    async def session(self, engine):
-        """Create async session for testing."""
-        async_session = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
-
-        async with async_session() as session:
-            yield session
-
     @pytest.mark.asyncio
-    async def test_integration_get_by_telegram_id_with_profiles(self, session):
+    async def test_integration_get_by_telegram_id_with_profiles(self, session, captured_sql):
         """Test get_by_telegram_id loads user with profiles."""
         # Create user with profiles
         user = User(user_id=123456789, native_language="ru", interface_language="ru")
-        session.add(user)
-        await session.commit()
-
         profile1 = LanguageProfile(
             user_id=123456789,
             target_language="en",
@@ -437,18 +360,24 @@ class TestUserRepositoryIntegration:
             target_language="es",
             level=CEFRLevel.A2
         )
-        session.add_all([profile1, profile2])
+        # One commit: the unit of work inserts the user before its profiles
+        session.add_all([user, profile1, profile2])
         await session.commit()
 
         # Get user by telegram ID
         repo = UserRepository(session)
-        retrieved_user = await repo.get_by_telegram_id(123456789)
+        with captured_sql() as queries:
+            retrieved_user = await repo.get_by_telegram_id(123456789)
+            # Accessing profiles must not trigger another query
+            target_languages = [p.target_language for p in retrieved_user.profiles]
+
+        # Main SELECT plus one selectinload IN query - no N+1
+        assert len(queries) == 2
 
         assert retrieved_user is not None
         assert retrieved_user.user_id == 123456789
         # Profiles should be eagerly loaded
         assert len(retrieved_user.profiles) == 2
-        target_languages = [p.target_language for p in retrieved_user.profiles]
         assert "en" in target_languages
         assert "es" in target_languages
 
@@ -456,8 +385,9 @@ class TestUserRepositoryIntegration:
     async def test_integration_get_users_for_notification(self, session):
         """Test get_users_for_notification with actual data."""
         # Create users with different last_active times
-        old_time = datetime.now(timezone.utc) - timedelta(hours=48)
-        recent_time = datetime.now(timezone.utc) - timedelta(hours=2)
+        now = datetime.now(timezone.utc)
+        old_time = now - timedelta(hours=48)
+        recent_time = now - timedelta(hours=2)
 
         user1 = User(
             user_id=100,
@@ -535,70 +465,41 @@ class TestUserRepositoryIntegration:
         assert retrieved.user_id == 999
 
 
+@pytest.mark.xdist_group(name="user_repo_integration")
 class TestProfileRepositoryIntegration:
     """Integration tests for ProfileRepository with actual database."""
 
-    @pytest.fixture
-    async def engine(self):
-        """Create async engine for testing."""
-        engine = create_async_engine(
-            "sqlite+aiosqlite:///:memory:",
-            echo=False
-        )
-
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        yield engine
-
-        await engine.dispose()
-
-    @pytest.fixture
-    async def session(self, engine):
-        """Create async session for testing."""
-        async_session = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
-
-        async with async_session() as session:
-            yield session
-
-    @pytest.fixture
-    async def user_with_profiles(self, session):
-        """Create a user with multiple profiles for testing."""
-        # Create user
-        user = User(user_id=123456789, native_language="ru", interface_language="ru")
-        session.add(user)
-        await session.commit()
-
-        # Create profiles
-        profile1 = LanguageProfile(
-            user_id=123456789,
-            target_language="en",
-            level=CEFRLevel.B1,
-            is_active=True
-        )
-        profile2 = LanguageProfile(
-            user_id=123456789,
-            target_language="es",
-            level=CEFRLevel.A2,
-            is_active=False
-        )
-        profile3 = LanguageProfile(
-            user_id=123456789,
-            target_language="de",
-            level=CEFRLevel.B2,
-            is_active=False
-        )
-        session.add_all([profile1, profile2, profile3])
-        await session.commit()
-
-        return user
+    @pytest.fixture(scope="class")
+    def integration_test_engine(self, seeded_integration_engine):
+        """
+        Create an engine whose database already holds a user with three profiles.
 
-    @pytest.mark.asyncio
-    async def test_integration_get_active_profile(self, session, user_with_profiles):
+        The rows are inserted once per class into a copy of the schema template,
+        and every test runs against that seeded snapshot. Changes made by a test
+        are rolled back by the ``session`` fixture.
+        """
+        from sqlalchemy import insert
+
+        def _seed(conn):
+            conn.execute(
+                insert(User).values(
+                    user_id=123456789, native_language="ru", interface_language="ru"
+                )
+            )
+            conn.execute(
+                insert(LanguageProfile),
+                [
+                    {"user_id": 123456789, "target_language": "en", "level": CEFRLevel.B1, "is_active": True},
+                    {"user_id": 123456789, "target_language": "es", "level": CEFRLevel.A2, "is_active": False},
+                    {"user_id": 123456789, "target_language": "de", "level": CEFRLevel.B2, "is_active": False},
+                ]
+            )
+
+        with seeded_integration_engine(_seed) as engine:
+            yield engine
+
+    @pytest.mark.asyncio
+    async def test_integration_get_active_profile(self, session):
         """Test get_active_profile returns the active profile."""
         repo = ProfileRepository(session)
         active_profile = await repo.get_active_profile(123456789)
@@ -608,7 +509,7 @@ class TestProfileRepositoryIntegration:
         assert active_profile.is_active is True
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_profiles(self, session, user_with_profiles):
+    async def test_integration_get_user_profiles(self, session):
         """Test get_user_profiles returns all profiles."""
         repo = ProfileRepository(session)
         profiles = await repo.get_user_profiles(123456789)
@@ -620,7 +521,7 @@ class TestProfileRepositoryIntegration:
         assert "de" in target_languages
 
     @pytest.mark.asyncio
-    async def test_integration_switch_active_language(self, session, user_with_profiles):
+    async def test_integration_switch_active_language(self, session):
         """Test switch_active_language switches the active profile."""
         repo = ProfileRepository(session)
 
@@ -645,7 +546,7 @@ class TestProfileRepositoryIntegration:
         assert en_profile.is_active is False
 
     @pytest.mark.asyncio
-    async def test_integration_switch_active_language_error_on_invalid_language(self, session, user_with_profiles):
+    async def test_integration_switch_active_language_error_on_invalid_language(self, session):
         """Test switch_active_language raises error for non-existent language."""
         repo = ProfileRepository(session)
 
@@ -683,7 +584,7 @@ class TestProfileRepositoryIntegration:
         assert retrieved.target_language == "en"
 
     @pytest.mark.asyncio
-    async def test_get_active_profile_eagerly_loads_user(self, session, user_with_profiles):
+    async def test_get_active_profile_eagerly_loads_user(self, session):
         """
         Test that get_active_profile() uses eager loading for user relationship.
 
@@ -732,45 +633,47 @@ class TestProfileRepositoryIntegration:
 class TestEdgeCases:
     """Tests for edge cases and error scenarios."""
 
+    @pytest.mark.parametrize(
+        "repo_class,method,kwargs",
+        [
+            (UserRepository, "get_users_for_notification", {"inactive_hours": 24, "current_hour": 10}),
+            (UserRepository, "get_users_for_notification", {"inactive_hours": 0, "current_hour": 10}),
+            (ProfileRepository, "get_user_profiles", {"user_id": 123456789}),
+        ],
+        ids=["notification_no_users", "notification_zero_inactive_hours", "profiles_no_profiles"]
+    )
+    @pytest.mark.asyncio
+    async def test_list_queries_return_empty_list_when_nothing_matches(
+        self, stub_session, repo_class, method, kwargs
+    ):
+        """Test that list queries execute once and return an empty list when no rows match."""
+        mock_session = stub_session
+        mock_session.returns([])
+
+        repo = repo_class(mock_session)
+        result = await getattr(repo, method)(**kwargs)
+
+        mock_session.execute.assert_called_once()
+        assert result == []
+
     @pytest.mark.asyncio
-    async def test_update_last_active_with_nonexistent_user(self):
+    async def test_update_last_active_with_nonexistent_user(self, stub_session):
         """Test update_last_active with user that doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = UserRepository(mock_session)
         # Should not raise error, just do nothing
         await repo.update_last_active(999999999)
 
-        mock_session.flush.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_get_users_for_notification_with_zero_inactive_hours(self):
-        """Test get_users_for_notification with zero inactive hours."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = UserRepository(mock_session)
-        result = await repo.get_users_for_notification(inactive_hours=0, current_hour=10)
-
-        # Should still execute the query
-        mock_session.execute.assert_called_once()
-        assert result == []
+        assert mock_session.mock_calls == [call.execute(ANY, ANY)]
 
     @pytest.mark.asyncio
-    async def test_switch_active_language_with_single_profile(self):
+    async def test_switch_active_language_with_single_profile(self, stub_session):
         """Test switch_active_language when user has only one profile."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
-        profile = LanguageProfile(
+        profile = _mk_profile(
             user_id=123456789,
             target_language="en",
             level=CEFRLevel.B1,
@@ -778,9 +681,7 @@ class TestEdgeCases:
         )
         profiles = [profile]
 
-        mock_scalars.all.return_value = profiles
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(profiles)
 
         repo = ProfileRepository(mock_session)
         result = await repo.switch_active_language(123456789, "en")
@@ -790,22 +691,20 @@ class TestEdgeCases:
         assert result is profile
 
     @pytest.mark.asyncio
-    async def test_get_active_profile_when_multiple_active(self):
+    async def test_get_active_profile_when_multiple_active(self, stub_session):
         """Test get_active_profile behavior when multiple profiles are active (data integrity issue)."""
         # This is an edge case that shouldn't happen in normal operation,
         # but we test that the method doesn't break
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
+        mock_session = stub_session
 
         # Returns first match
-        mock_profile = LanguageProfile(
+        mock_profile = _mk_profile(
             user_id=123456789,
             target_language="en",
             level=CEFRLevel.B1,
             is_active=True
         )
-        mock_result.scalar_one_or_none.return_value = mock_profile
-        mock_session.execute.return_value = mock_result
+        mock_session.returns_one(mock_profile)
 
         repo = ProfileRepository(mock_session)
         result = await repo.get_active_profile(123456789)
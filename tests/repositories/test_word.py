@@ -11,52 +11,19 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import select
+from sqlalchemy import inspect, select, insert
 
 from src.words.repositories.word import WordRepository, UserWordRepository
-from src.words.models import Base, Word, UserWord, WordStatusEnum, User, LanguageProfile, CEFRLevel, WordStatistics
-
-
-# Module-level fixtures for integration tests
-@pytest.fixture
-async def integration_engine():
-    """Create async engine for integration testing."""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        echo=False
-    )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    yield engine
-
-    await engine.dispose()
-
-
-@pytest.fixture
-async def integration_session(integration_engine):
-    """Create async session for integration testing."""
-    async_session = async_sessionmaker(
-        integration_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        yield session
+from src.words.models import Word, UserWord, WordStatusEnum, User, LanguageProfile, CEFRLevel, WordStatistics
 
 
 class TestWordRepositoryInitialization:
     """Tests for WordRepository initialization."""
 
-    @pytest.mark.asyncio
-    async def test_word_repository_initialization(self):
+    def test_word_repository_initialization(self, stub_session):
         """Test that WordRepository can be initialized with session."""
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = stub_session
         repo = WordRepository(mock_session)
 
         assert repo.session is mock_session
@@ -66,169 +33,81 @@ class TestWordRepositoryInitialization:
 class TestFindByTextAndLanguage:
     """Tests for find_by_text_and_language method."""
 
+    @pytest.mark.parametrize(
+        "text,language,stored",
+        [
+            ("hello", "en", "hello"),
+            ("nonexistent", "en", None),
+            ("HELLO", "en", "hello"),
+            ("hello", "ru", None),
+        ],
+        ids=["found", "not_found", "case_insensitive", "other_language"]
+    )
     @pytest.mark.asyncio
-    async def test_find_by_text_and_language_returns_word_when_found(self):
-        """Test that find_by_text_and_language returns word when it exists."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_word = Word(
-            word_id=1,
-            word="hello",
-            language="en",
-            level="A1",
-            frequency_rank=100
-        )
-        mock_result.scalar_one_or_none.return_value = mock_word
-        mock_session.execute.return_value = mock_result
-
-        repo = WordRepository(mock_session)
-        result = await repo.find_by_text_and_language("hello", "en")
-
-        assert result is mock_word
-        mock_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_find_by_text_and_language_returns_none_when_not_found(self):
-        """Test that find_by_text_and_language returns None when word doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-
-        repo = WordRepository(mock_session)
-        result = await repo.find_by_text_and_language("nonexistent", "en")
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_find_by_text_and_language_case_insensitive(self):
-        """Test that find_by_text_and_language normalizes to lowercase."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_word = Word(word_id=1, word="hello", language="en")
-        mock_result.scalar_one_or_none.return_value = mock_word
-        mock_session.execute.return_value = mock_result
+    async def test_find_by_text_and_language(self, stub_session, text, language, stored):
+        """Test that find_by_text_and_language returns the matching word or None."""
+        mock_session = stub_session
+        word = Word(word_id=1, word=stored, language=language) if stored else None
+        mock_session.returns_one(word)
 
         repo = WordRepository(mock_session)
-        # Search with mixed case
-        result = await repo.find_by_text_and_language("HELLO", "en")
+        result = await repo.find_by_text_and_language(text, language)
 
-        # Should still find the word (lowercase comparison)
+        assert result is word
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_find_by_text_and_language_filters_by_language(self):
-        """Test that find_by_text_and_language filters by language correctly."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+    async def test_find_by_text_and_language_reuses_statement_across_calls(self, stub_session):
+        """Test that lookups execute one prebuilt statement with bound parameters."""
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = WordRepository(mock_session)
-        # Same word different language shouldn't match
-        result = await repo.find_by_text_and_language("hello", "ru")
+        await repo.find_by_text_and_language("Hello", "en")
+        await repo.find_by_text_and_language("world", "ru")
 
-        assert result is None
+        first, second = mock_session.execute.call_args_list
+        assert first.args[0] is second.args[0]
+        assert first.args[1] == {"word": "hello", "language": "en"}
+        assert second.args[1] == {"word": "world", "language": "ru"}
 
 
 class TestGetFrequencyWords:
     """Tests for get_frequency_words method."""
 
+    @pytest.mark.parametrize(
+        "language,level,limit,stored",
+        [
+            ("en", "A1", 50, [("hello", 1), ("world", 2), ("good", 3)]),
+            ("zh", "C2", 50, []),
+            ("en", "A1", 10, [(f"word{i}", i) for i in range(1, 11)]),
+            ("en", "A1", 50, [("the", 1), ("be", 2), ("to", 3)]),
+        ],
+        ids=["for_level", "no_words", "respects_limit", "ordered_by_rank"]
+    )
     @pytest.mark.asyncio
-    async def test_get_frequency_words_returns_words_for_level(self):
-        """Test that get_frequency_words returns words for a specific level."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-
-        words = [
-            Word(word_id=1, word="hello", language="en", level="A1", frequency_rank=1),
-            Word(word_id=2, word="world", language="en", level="A1", frequency_rank=2),
-            Word(word_id=3, word="good", language="en", level="A1", frequency_rank=3)
-        ]
-        mock_scalars.all.return_value = words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = WordRepository(mock_session)
-        result = await repo.get_frequency_words("en", "A1", limit=50)
-
-        assert len(result) == 3
-        assert result[0].word == "hello"
-        assert result[1].word == "world"
-        assert result[2].word == "good"
-
-    @pytest.mark.asyncio
-    async def test_get_frequency_words_returns_empty_list_when_no_words(self):
-        """Test that get_frequency_words returns empty list when no words match."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = WordRepository(mock_session)
-        result = await repo.get_frequency_words("zh", "C2", limit=50)
-
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_get_frequency_words_respects_limit(self):
-        """Test that get_frequency_words respects the limit parameter."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-
-        # Create 100 words
+    async def test_get_frequency_words(self, stub_session, language, level, limit, stored):
+        """Test that get_frequency_words returns the level's words in rank order."""
+        mock_session = stub_session
         words = [
-            Word(word_id=i, word=f"word{i}", language="en", level="A1", frequency_rank=i)
-            for i in range(1, 11)
+            Word(word_id=rank, word=text, language=language, level=level, frequency_rank=rank)
+            for text, rank in stored
         ]
-        mock_scalars.all.return_value = words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(words)
 
         repo = WordRepository(mock_session)
-        result = await repo.get_frequency_words("en", "A1", limit=10)
+        result = await repo.get_frequency_words(language, level, limit=limit)
 
-        # Verify execute was called with limit
+        assert [(w.word, w.frequency_rank) for w in result] == stored
         mock_session.execute.assert_called_once()
-        assert len(result) == 10
-
-    @pytest.mark.asyncio
-    async def test_get_frequency_words_orders_by_frequency_rank(self):
-        """Test that get_frequency_words orders by frequency rank."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-
-        # Create words with different frequency ranks
-        words = [
-            Word(word_id=1, word="the", language="en", level="A1", frequency_rank=1),
-            Word(word_id=2, word="be", language="en", level="A1", frequency_rank=2),
-            Word(word_id=3, word="to", language="en", level="A1", frequency_rank=3)
-        ]
-        mock_scalars.all.return_value = words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = WordRepository(mock_session)
-        result = await repo.get_frequency_words("en", "A1", limit=50)
-
-        # Words should be ordered by frequency rank
-        assert result[0].frequency_rank == 1
-        assert result[1].frequency_rank == 2
-        assert result[2].frequency_rank == 3
 
 
 class TestUserWordRepositoryInitialization:
     """Tests for UserWordRepository initialization."""
 
-    @pytest.mark.asyncio
-    async def test_user_word_repository_initialization(self):
+    def test_user_word_repository_initialization(self, stub_session):
         """Test that UserWordRepository can be initialized with session."""
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = stub_session
         repo = UserWordRepository(mock_session)
 
         assert repo.session is mock_session
@@ -239,18 +118,16 @@ class TestGetUserWord:
     """Tests for get_user_word method."""
 
     @pytest.mark.asyncio
-    async def test_get_user_word_returns_user_word_when_found(self):
+    async def test_get_user_word_returns_user_word_when_found(self, stub_session):
         """Test that get_user_word returns user word when it exists."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
+        mock_session = stub_session
         mock_user_word = UserWord(
             user_word_id=1,
             profile_id=100,
             word_id=200,
             status=WordStatusEnum.LEARNING
         )
-        mock_result.scalar_one_or_none.return_value = mock_user_word
-        mock_session.execute.return_value = mock_result
+        mock_session.returns_one(mock_user_word)
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_word(profile_id=100, word_id=200)
@@ -259,51 +136,31 @@ class TestGetUserWord:
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_user_word_returns_none_when_not_found(self):
+    async def test_get_user_word_returns_none_when_not_found(self, stub_session):
         """Test that get_user_word returns None when user word doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_word(profile_id=999, word_id=999)
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_get_user_word_uses_selectinload_for_relationships(self):
-        """Test that get_user_word uses selectinload to eagerly load relationships."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
-
-        repo = UserWordRepository(mock_session)
-        await repo.get_user_word(profile_id=100, word_id=200)
-
-        # Verify execute was called (selectinload is used in the query)
-        mock_session.execute.assert_called_once()
-
 
 class TestGetUserVocabulary:
     """Tests for get_user_vocabulary method."""
 
     @pytest.mark.asyncio
-    async def test_get_user_vocabulary_returns_all_words(self):
+    async def test_get_user_vocabulary_returns_all_words(self, stub_session):
         """Test that get_user_vocabulary returns all user words."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         user_words = [
             UserWord(user_word_id=1, profile_id=100, word_id=1, status=WordStatusEnum.NEW),
             UserWord(user_word_id=2, profile_id=100, word_id=2, status=WordStatusEnum.LEARNING),
             UserWord(user_word_id=3, profile_id=100, word_id=3, status=WordStatusEnum.REVIEWING)
         ]
-        mock_scalars.all.return_value = user_words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(user_words)
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_vocabulary(profile_id=100)
@@ -314,19 +171,15 @@ class TestGetUserVocabulary:
         assert result[2].status == WordStatusEnum.REVIEWING
 
     @pytest.mark.asyncio
-    async def test_get_user_vocabulary_filters_by_status(self):
+    async def test_get_user_vocabulary_filters_by_status(self, stub_session):
         """Test that get_user_vocabulary filters by status when provided."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         # Only learning words
         user_words = [
             UserWord(user_word_id=2, profile_id=100, word_id=2, status=WordStatusEnum.LEARNING)
         ]
-        mock_scalars.all.return_value = user_words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(user_words)
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_vocabulary(profile_id=100, status=WordStatusEnum.LEARNING)
@@ -335,14 +188,10 @@ class TestGetUserVocabulary:
         assert result[0].status == WordStatusEnum.LEARNING
 
     @pytest.mark.asyncio
-    async def test_get_user_vocabulary_returns_empty_list_when_no_words(self):
+    async def test_get_user_vocabulary_returns_empty_list_when_no_words(self, stub_session):
         """Test that get_user_vocabulary returns empty list when user has no words."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns([])
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_vocabulary(profile_id=999)
@@ -350,35 +199,15 @@ class TestGetUserVocabulary:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_user_vocabulary_uses_selectinload_for_relationships(self):
-        """Test that get_user_vocabulary uses selectinload to eagerly load relationships."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
-
-        repo = UserWordRepository(mock_session)
-        await repo.get_user_vocabulary(profile_id=100)
-
-        # Verify execute was called (selectinload is used in the query)
-        mock_session.execute.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_user_vocabulary_with_none_status(self):
+    async def test_get_user_vocabulary_with_none_status(self, stub_session):
         """Test that get_user_vocabulary works with None status (no filter)."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
+        mock_session = stub_session
 
         user_words = [
             UserWord(user_word_id=1, profile_id=100, word_id=1, status=WordStatusEnum.NEW),
             UserWord(user_word_id=2, profile_id=100, word_id=2, status=WordStatusEnum.MASTERED)
         ]
-        mock_scalars.all.return_value = user_words
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session.returns(user_words)
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_vocabulary(profile_id=100, status=None)
@@ -389,84 +218,54 @@ class TestGetUserVocabulary:
 class TestCountByStatus:
     """Tests for count_by_status method."""
 
+    @pytest.mark.parametrize(
+        "rows,expected",
+        [
+            (
+                [
+                    (WordStatusEnum.NEW, 5),
+                    (WordStatusEnum.LEARNING, 10),
+                    (WordStatusEnum.REVIEWING, 15),
+                    (WordStatusEnum.MASTERED, 20)
+                ],
+                {"new": 5, "learning": 10, "reviewing": 15, "mastered": 20}
+            ),
+            ([], {}),
+            (
+                [(WordStatusEnum.NEW, 3), (WordStatusEnum.LEARNING, 7)],
+                {"new": 3, "learning": 7}
+            ),
+        ],
+        ids=["all_statuses", "no_words", "partial_statuses"]
+    )
     @pytest.mark.asyncio
-    async def test_count_by_status_returns_counts_for_all_statuses(self):
-        """Test that count_by_status returns counts grouped by status."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-
-        # Mock result with status counts
-        mock_result.all.return_value = [
-            (WordStatusEnum.NEW, 5),
-            (WordStatusEnum.LEARNING, 10),
-            (WordStatusEnum.REVIEWING, 15),
-            (WordStatusEnum.MASTERED, 20)
-        ]
-        mock_session.execute.return_value = mock_result
-
-        repo = UserWordRepository(mock_session)
-        result = await repo.count_by_status(profile_id=100)
-
-        assert result == {
-            "new": 5,
-            "learning": 10,
-            "reviewing": 15,
-            "mastered": 20
-        }
-
-    @pytest.mark.asyncio
-    async def test_count_by_status_returns_empty_dict_when_no_words(self):
-        """Test that count_by_status returns empty dict when user has no words."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.all.return_value = []
-        mock_session.execute.return_value = mock_result
-
-        repo = UserWordRepository(mock_session)
-        result = await repo.count_by_status(profile_id=999)
-
-        assert result == {}
-
-    @pytest.mark.asyncio
-    async def test_count_by_status_with_partial_statuses(self):
-        """Test that count_by_status returns only existing statuses."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-
-        # Only some statuses have counts
-        mock_result.all.return_value = [
-            (WordStatusEnum.NEW, 3),
-            (WordStatusEnum.LEARNING, 7)
-        ]
-        mock_session.execute.return_value = mock_result
+    async def test_count_by_status(self, stub_session, rows, expected):
+        """Test that count_by_status returns counts only for statuses that have words."""
+        mock_session = stub_session
+        mock_session.returns(rows)
 
         repo = UserWordRepository(mock_session)
         result = await repo.count_by_status(profile_id=100)
 
-        assert result == {
-            "new": 3,
-            "learning": 7
-        }
-        # Verify statuses with 0 count are not included
-        assert "reviewing" not in result
-        assert "mastered" not in result
+        assert result == expected
 
 
+@pytest.mark.xdist_group(name="word_repo_integration")
 class TestWordRepositoryIntegration:
     """Integration tests for WordRepository with actual database."""
 
     @pytest.mark.asyncio
-    async def test_integration_find_by_text_and_language(self, integration_session):
+    async def test_integration_find_by_text_and_language(self, session):
         """Test find_by_text_and_language with actual database."""
         # Create words
         word1 = Word(word="hello", language="en", level="A1", frequency_rank=1)
         word2 = Word(word="hello", language="ru", level="A1", frequency_rank=100)
         word3 = Word(word="world", language="en", level="A1", frequency_rank=2)
-        integration_session.add_all([word1, word2, word3])
-        await integration_session.commit()
+        session.add_all([word1, word2, word3])
+        await session.flush()
 
         # Test finding by text and language
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Find English "hello"
         result = await repo.find_by_text_and_language("hello", "en")
@@ -485,14 +284,14 @@ class TestWordRepositoryIntegration:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_integration_find_by_text_and_language_case_insensitive(self, integration_session):
+    async def test_integration_find_by_text_and_language_case_insensitive(self, session):
         """Test case-insensitive lookup in find_by_text_and_language."""
         # Create word in lowercase
         word = Word(word="hello", language="en", level="A1")
-        integration_session.add(word)
-        await integration_session.commit()
+        session.add(word)
+        await session.flush()
 
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Search with various cases
         result1 = await repo.find_by_text_and_language("hello", "en")
@@ -505,20 +304,43 @@ class TestWordRepositoryIntegration:
         assert result1.word_id == result2.word_id == result3.word_id
 
     @pytest.mark.asyncio
-    async def test_integration_get_frequency_words(self, integration_session):
+    async def test_find_by_text_and_language_uses_word_language_index(self, session, captured_sql):
+        """Test that the case-insensitive lookup is an index search, not a table scan.
+
+        Words are stored lowercase, so comparing the column against the
+        lowercased input lets the (word, language) unique index serve the
+        lookup without a functional index on lower(word).
+        """
+        with captured_sql(parameters=True) as queries:
+            await WordRepository(session).find_by_text_and_language("Hello", "en")
+
+        statement, parameters = queries[-1]
+        assert "lower(" not in statement.lower()
+        assert parameters[0] == "hello"
+
+        connection = await session.connection()
+        plan = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = " ".join(row[3] for row in plan)
+        assert "USING INDEX" in details
+        assert "SCAN" not in details
+
+    @pytest.mark.asyncio
+    async def test_integration_get_frequency_words(self, session):
         """Test get_frequency_words with actual database."""
-        # Create words with different levels and frequencies
-        words = [
-            Word(word="the", language="en", level="A1", frequency_rank=1),
-            Word(word="be", language="en", level="A1", frequency_rank=2),
-            Word(word="to", language="en", level="A1", frequency_rank=3),
-            Word(word="complex", language="en", level="B2", frequency_rank=500),
-            Word(word="sophisticated", language="en", level="C1", frequency_rank=1000)
-        ]
-        integration_session.add_all(words)
-        await integration_session.commit()
+        # Create words with different levels and frequencies (one executemany)
+        await session.execute(
+            insert(Word),
+            [
+                {"word": "the", "language": "en", "level": "A1", "frequency_rank": 1},
+                {"word": "be", "language": "en", "level": "A1", "frequency_rank": 2},
+                {"word": "to", "language": "en", "level": "A1", "frequency_rank": 3},
+                {"word": "complex", "language": "en", "level": "B2", "frequency_rank": 500},
+                {"word": "sophisticated", "language": "en", "level": "C1", "frequency_rank": 1000},
+            ]
+        )
+        await session.flush()
 
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Get A1 words
         result = await repo.get_frequency_words("en", "A1", limit=50)
@@ -537,17 +359,19 @@ class TestWordRepositoryIntegration:
         assert len(result) == 0
 
     @pytest.mark.asyncio
-    async def test_integration_get_frequency_words_respects_limit(self, integration_session):
+    async def test_integration_get_frequency_words_respects_limit(self, session):
         """Test that get_frequency_words respects the limit parameter."""
-        # Create 100 words
-        words = [
-            Word(word=f"word{i}", language="en", level="A1", frequency_rank=i)
-            for i in range(1, 101)
-        ]
-        integration_session.add_all(words)
-        await integration_session.commit()
+        # Create 100 words with a single executemany INSERT
+        await session.execute(
+            insert(Word),
+            [
+                {"word": f"word{i}", "language": "en", "level": "A1", "frequency_rank": i}
+                for i in range(1, 101)
+            ]
+        )
+        await session.flush()
 
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Test different limits
         result = await repo.get_frequency_words("en", "A1", limit=10)
@@ -559,9 +383,9 @@ class TestWordRepositoryIntegration:
         assert len(result) == 50
 
     @pytest.mark.asyncio
-    async def test_integration_word_repository_inherits_base_methods(self, integration_session):
+    async def test_integration_word_repository_inherits_base_methods(self, session):
         """Test that WordRepository can use base CRUD methods."""
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Test add
         word = Word(word="test", language="en", level="A1")
@@ -580,39 +404,39 @@ class TestWordRepositoryIntegration:
         assert len(all_words) >= 1
 
     @pytest.mark.asyncio
-    async def test_word_validation_normalizes_to_lowercase_on_insert(self, integration_session):
+    async def test_word_validation_normalizes_to_lowercase_on_insert(self, session):
         """Test that Word model @validates decorator normalizes word to lowercase on insert."""
         # Create word with mixed case
         word = Word(word="HELLO", language="en", level="A1")
-        integration_session.add(word)
-        await integration_session.commit()
+        session.add(word)
+        await session.flush()
 
         # Retrieve and verify it's stored in lowercase
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
         retrieved = await repo.get_by_id(word.word_id)
         assert retrieved is not None
         assert retrieved.word == "hello"  # Should be normalized to lowercase
 
     @pytest.mark.asyncio
-    async def test_word_validation_normalizes_to_lowercase_on_update(self, integration_session):
+    async def test_word_validation_normalizes_to_lowercase_on_update(self, session):
         """Test that Word model @validates decorator normalizes word to lowercase on update."""
         # Create word in lowercase
         word = Word(word="world", language="en", level="A1")
-        integration_session.add(word)
-        await integration_session.commit()
+        session.add(word)
+        await session.flush()
 
         # Update with mixed case
         word.word = "WORLD"
-        await integration_session.commit()
+        await session.flush()
 
         # Retrieve and verify it's normalized to lowercase
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
         retrieved = await repo.get_by_id(word.word_id)
         assert retrieved is not None
         assert retrieved.word == "world"  # Should be normalized to lowercase
 
     @pytest.mark.asyncio
-    async def test_word_validation_ensures_data_integrity_for_case_insensitive_lookup(self, integration_session):
+    async def test_word_validation_ensures_data_integrity_for_case_insensitive_lookup(self, session):
         """Test that @validates decorator ensures consistent data for case-insensitive lookups."""
         # Create words with various cases - should all be normalized to lowercase
         words = [
@@ -620,11 +444,11 @@ class TestWordRepositoryIntegration:
             Word(word="PYTHON", language="en", level="A2"),
             Word(word="JavaScript", language="en", level="B1")
         ]
-        integration_session.add_all(words)
-        await integration_session.commit()
+        session.add_all(words)
+        await session.flush()
 
         # Verify all are stored in lowercase
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
         computer = await repo.find_by_text_and_language("computer", "en")
         python = await repo.find_by_text_and_language("python", "en")
         javascript = await repo.find_by_text_and_language("javascript", "en")
@@ -637,9 +461,9 @@ class TestWordRepositoryIntegration:
         assert javascript.word == "javascript"
 
     @pytest.mark.asyncio
-    async def test_find_by_text_returns_none_for_empty_string(self, integration_session):
+    async def test_find_by_text_returns_none_for_empty_string(self, session):
         """Test that find_by_text_and_language returns None for empty string (early return)."""
-        repo = WordRepository(integration_session)
+        repo = WordRepository(session)
 
         # Test with empty string
         result = await repo.find_by_text_and_language("", "en")
@@ -654,74 +478,75 @@ class TestWordRepositoryIntegration:
         assert result is None
 
 
+@pytest.mark.xdist_group(name="word_repo_integration")
 class TestUserWordRepositoryIntegration:
     """Integration tests for UserWordRepository with actual database."""
 
-    @pytest.fixture
-    async def setup_data(self, integration_session):
-        """Create test data: user, profile, words, and user_words."""
-        # Create user
-        user = User(user_id=123456789, native_language="ru", interface_language="ru")
-        integration_session.add(user)
-        await integration_session.commit()
-
-        # Create profile
-        profile = LanguageProfile(
-            user_id=123456789,
-            target_language="en",
-            level=CEFRLevel.B1,
-            is_active=True
-        )
-        integration_session.add(profile)
-        await integration_session.commit()
-
-        # Create words
-        words = [
-            Word(word="hello", language="en", level="A1", frequency_rank=1),
-            Word(word="world", language="en", level="A1", frequency_rank=2),
-            Word(word="computer", language="en", level="A2", frequency_rank=100)
-        ]
-        integration_session.add_all(words)
-        await integration_session.commit()
-
-        # Create user_words
-        user_words = [
-            UserWord(
-                profile_id=profile.profile_id,
-                word_id=words[0].word_id,
-                status=WordStatusEnum.NEW,
-                added_at=datetime.now(timezone.utc)
-            ),
-            UserWord(
-                profile_id=profile.profile_id,
-                word_id=words[1].word_id,
-                status=WordStatusEnum.LEARNING,
-                added_at=datetime.now(timezone.utc)
-            ),
-            UserWord(
-                profile_id=profile.profile_id,
-                word_id=words[2].word_id,
-                status=WordStatusEnum.MASTERED,
-                added_at=datetime.now(timezone.utc)
+    # Primary keys of the rows seeded into this class's database
+    seeded_ids = {
+        "profile_id": 1,
+        "word_ids": [1, 2, 3],
+        "user_word_ids": [1, 2, 3],
+    }
+
+    @pytest.fixture(scope="class")
+    def integration_test_engine(self, seeded_integration_engine, warm_statement_cache):
+        """
+        Create an engine seeded once with a user, profile, 3 words and 3 user_words.
+
+        Every test in the class sees the same reference rows; anything a test
+        writes is rolled back by the ``session`` fixture. The word repository
+        queries are compiled before the first test runs.
+        """
+        from sqlalchemy import insert
+
+        def _seed(conn):
+            added_at = datetime.now(timezone.utc)
+            conn.execute(
+                insert(User).values(
+                    user_id=123456789, native_language="ru", interface_language="ru"
+                )
+            )
+            conn.execute(
+                insert(LanguageProfile).values(
+                    profile_id=1,
+                    user_id=123456789,
+                    target_language="en",
+                    level=CEFRLevel.B1,
+                    is_active=True
+                )
+            )
+            conn.execute(
+                insert(Word),
+                [
+                    {"word_id": 1, "word": "hello", "language": "en", "level": "A1", "frequency_rank": 1},
+                    {"word_id": 2, "word": "world", "language": "en", "level": "A1", "frequency_rank": 2},
+                    {"word_id": 3, "word": "computer", "language": "en", "level": "A2", "frequency_rank": 100},
+                ]
+            )
+            conn.execute(
+                insert(UserWord),
+                [
+                    {"user_word_id": 1, "profile_id": 1, "word_id": 1,
+                     "status": WordStatusEnum.NEW, "added_at": added_at},
+                    {"user_word_id": 2, "profile_id": 1, "word_id": 2,
+                     "status": WordStatusEnum.LEARNING, "added_at": added_at},
+                    {"user_word_id": 3, "profile_id": 1, "word_id": 3,
+                     "status": WordStatusEnum.MASTERED, "added_at": added_at},
+                ]
             )
-        ]
-        integration_session.add_all(user_words)
-        await integration_session.commit()
-
-        return {
-            "user": user,
-            "profile": profile,
-            "words": words,
-            "user_words": user_words
-        }
+
+        with seeded_integration_engine(_seed) as engine:
+            warm_statement_cache(engine)
+            yield engine
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_word(self, integration_session, setup_data):
+    async def test_integration_get_user_word(self, session):
         """Test get_user_word with actual database and eager loading."""
-        profile_id = setup_data["profile"].profile_id
-        word_id = setup_data["words"][0].word_id
+        profile_id = self.seeded_ids["profile_id"]
+        word_id = self.seeded_ids["word_ids"][0]
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
         user_word = await repo.get_user_word(profile_id=profile_id, word_id=word_id)
 
         assert user_word is not None
@@ -729,17 +554,17 @@ class TestUserWordRepositoryIntegration:
         assert user_word.word_id == word_id
         assert user_word.status == WordStatusEnum.NEW
 
-        # Verify eager loading - relationships should be loaded
-        assert user_word.word is not None
+        # Verify eager loading without touching the attributes, which would
+        # otherwise fall back to a lazy load
+        assert inspect(user_word).unloaded.isdisjoint({"word", "statistics"})
         assert user_word.word.word == "hello"
-        assert user_word.statistics is not None  # Empty list is fine
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_word_with_statistics(self, integration_session, setup_data):
+    async def test_integration_get_user_word_with_statistics(self, session):
         """Test get_user_word eager loads statistics."""
-        profile_id = setup_data["profile"].profile_id
-        word_id = setup_data["words"][0].word_id
-        user_word_id = setup_data["user_words"][0].user_word_id
+        profile_id = self.seeded_ids["profile_id"]
+        word_id = self.seeded_ids["word_ids"][0]
+        user_word_id = self.seeded_ids["user_word_ids"][0]
 
         # Add statistics
         stat = WordStatistics(
@@ -751,10 +576,10 @@ class TestUserWordRepositoryIntegration:
             total_correct=5,
             total_errors=5
         )
-        integration_session.add(stat)
-        await integration_session.commit()
+        session.add(stat)
+        await session.flush()
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
         user_word = await repo.get_user_word(profile_id=profile_id, word_id=word_id)
 
         assert user_word is not None
@@ -763,19 +588,33 @@ class TestUserWordRepositoryIntegration:
         assert user_word.statistics[0].correct_count == 5
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_word_not_found(self, integration_session, setup_data):
+    async def test_integration_get_user_word_selectinloads_relationships(self, session, captured_sql):
+        """Test that get_user_word loads word and statistics with selectin IN queries."""
+        repo = UserWordRepository(session)
+        with captured_sql() as statements:
+            await repo.get_user_word(
+                profile_id=self.seeded_ids["profile_id"],
+                word_id=self.seeded_ids["word_ids"][0]
+            )
+
+        assert len(statements) == 3
+        assert any("FROM words" in s and "IN (" in s for s in statements)
+        assert any("FROM word_statistics" in s and "IN (" in s for s in statements)
+
+    @pytest.mark.asyncio
+    async def test_integration_get_user_word_not_found(self, session):
         """Test get_user_word returns None when not found."""
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
 
         result = await repo.get_user_word(profile_id=999, word_id=999)
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_vocabulary(self, integration_session, setup_data):
+    async def test_integration_get_user_vocabulary(self, session):
         """Test get_user_vocabulary returns all user words."""
-        profile_id = setup_data["profile"].profile_id
+        profile_id = self.seeded_ids["profile_id"]
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
         vocabulary = await repo.get_user_vocabulary(profile_id=profile_id)
 
         assert len(vocabulary) == 3
@@ -786,15 +625,26 @@ class TestUserWordRepositoryIntegration:
 
         # Verify eager loading
         for uw in vocabulary:
-            assert uw.word is not None
-            assert uw.statistics is not None
+            assert inspect(uw).unloaded.isdisjoint({"word", "statistics"})
+
+    @pytest.mark.asyncio
+    async def test_integration_get_user_vocabulary_selectinloads_relationships(self, session, captured_sql):
+        """Test that get_user_vocabulary batches relationship loads into selectin IN queries."""
+        repo = UserWordRepository(session)
+        with captured_sql() as statements:
+            await repo.get_user_vocabulary(profile_id=self.seeded_ids["profile_id"])
+
+        # One query for the user words plus one per relationship, not per row
+        assert len(statements) == 3
+        assert any("FROM words" in s and "IN (" in s for s in statements)
+        assert any("FROM word_statistics" in s and "IN (" in s for s in statements)
 
     @pytest.mark.asyncio
-    async def test_integration_get_user_vocabulary_filtered_by_status(self, integration_session, setup_data):
+    async def test_integration_get_user_vocabulary_filtered_by_status(self, session):
         """Test get_user_vocabulary with status filter."""
-        profile_id = setup_data["profile"].profile_id
+        profile_id = self.seeded_ids["profile_id"]
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
 
         # Get only LEARNING words
         learning_words = await repo.get_user_vocabulary(
@@ -816,11 +666,11 @@ class TestUserWordRepositoryIntegration:
         assert mastered_words[0].status == WordStatusEnum.MASTERED
 
     @pytest.mark.asyncio
-    async def test_integration_count_by_status(self, integration_session, setup_data):
+    async def test_integration_count_by_status(self, session):
         """Test count_by_status returns correct counts."""
-        profile_id = setup_data["profile"].profile_id
+        profile_id = self.seeded_ids["profile_id"]
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
         counts = await repo.count_by_status(profile_id=profile_id)
 
         assert counts == {
@@ -830,25 +680,36 @@ class TestUserWordRepositoryIntegration:
         }
 
     @pytest.mark.asyncio
-    async def test_integration_count_by_status_empty(self, integration_session, setup_data):
+    async def test_integration_count_by_status_empty(self, session):
         """Test count_by_status returns empty dict for profile with no words."""
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
 
         # Non-existent profile
         counts = await repo.count_by_status(profile_id=999)
         assert counts == {}
 
     @pytest.mark.asyncio
-    async def test_integration_user_word_repository_inherits_base_methods(self, integration_session, setup_data):
+    async def test_integration_count_by_status_aggregates_in_sql(self, session, captured_sql):
+        """Test that count_by_status counts with one GROUP BY query, not by loading rows."""
+        repo = UserWordRepository(session)
+        with captured_sql() as statements:
+            await repo.count_by_status(profile_id=self.seeded_ids["profile_id"])
+
+        assert len(statements) == 1
+        assert "count(" in statements[0].lower()
+        assert "GROUP BY user_words.status" in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_integration_user_word_repository_inherits_base_methods(self, session):
         """Test that UserWordRepository can use base CRUD methods."""
-        profile_id = setup_data["profile"].profile_id
+        profile_id = self.seeded_ids["profile_id"]
 
         # Create a new word
         word = Word(word="test", language="en", level="A1")
-        integration_session.add(word)
-        await integration_session.commit()
+        session.add(word)
+        await session.flush()
 
-        repo = UserWordRepository(integration_session)
+        repo = UserWordRepository(session)
 
         # Test add
         user_word = UserWord(
@@ -872,12 +733,10 @@ class TestEdgeCases:
     """Tests for edge cases and error scenarios."""
 
     @pytest.mark.asyncio
-    async def test_find_by_text_and_language_with_empty_string(self):
+    async def test_find_by_text_and_language_with_empty_string(self, stub_session):
         """Test find_by_text_and_language with empty string returns None immediately."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns_one(None)
 
         repo = WordRepository(mock_session)
         result = await repo.find_by_text_and_language("", "en")
@@ -887,14 +746,10 @@ class TestEdgeCases:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_frequency_words_with_zero_limit(self):
+    async def test_get_frequency_words_with_zero_limit(self, stub_session):
         """Test get_frequency_words with limit=0."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns([])
 
         repo = WordRepository(mock_session)
         result = await repo.get_frequency_words("en", "A1", limit=0)
@@ -904,14 +759,10 @@ class TestEdgeCases:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_user_vocabulary_for_nonexistent_profile(self):
+    async def test_get_user_vocabulary_for_nonexistent_profile(self, stub_session):
         """Test get_user_vocabulary for profile that doesn't exist."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_session.execute.return_value = mock_result
+        mock_session = stub_session
+        mock_session.returns([])
 
         repo = UserWordRepository(mock_session)
         result = await repo.get_user_vocabulary(profile_id=999999)
@@ -920,16 +771,14 @@ class TestEdgeCases:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_count_by_status_with_all_words_same_status(self):
+    async def test_count_by_status_with_all_words_same_status(self, stub_session):
         """Test count_by_status when all words have the same status."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
+        mock_session = stub_session
 
         # All words are NEW
-        mock_result.all.return_value = [
+        mock_session.returns([
             (WordStatusEnum.NEW, 50)
-        ]
-        mock_session.execute.return_value = mock_result
+        ])
 
         repo = UserWordRepository(mock_session)
         result = await repo.count_by_status(profile_id=100)
@@ -0,0 +1,56 @@
+"""
+Shared fixtures for service unit tests.
+
+Service dependencies are replaced by small stub classes that expose only
+the methods the services call. Unlike ``AsyncMock(spec=...)`` they need no
+spec introspection, yet each method is still an AsyncMock, so tests keep
+configuring ``return_value``/``side_effect`` and asserting on calls.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+class _StubLLMClient:
+    """Cheap stand-in for LLMClient in TranslationService tests."""
+
+    __slots__ = ("translate_word", "validate_answer")
+
+    def __init__(self):
+        self.translate_word = AsyncMock()
+        self.validate_answer = AsyncMock()
+
+
+class _StubCacheRepository:
+    """Cheap stand-in for CacheRepository in TranslationService tests."""
+
+    __slots__ = ("get_translation", "set_translation", "get_validation", "set_validation")
+
+    def __init__(self):
+        self.get_translation = AsyncMock()
+        self.set_translation = AsyncMock()
+        self.get_validation = AsyncMock()
+        self.set_validation = AsyncMock()
+
+
+@pytest.fixture
+def mock_llm_client():
+    """
+    Provide a fresh LLM client stub.
+
+    Returns:
+        _StubLLMClient: Stub with async translate_word/validate_answer
+    """
+    return _StubLLMClient()
+
+
+@pytest.fixture
+def mock_cache_repo():
+    """
+    Provide a fresh cache repository stub.
+
+    Returns:
+        _StubCacheRepository: Stub with async get/set translation and
+            validation methods
+    """
+    return _StubCacheRepository()
@@ -5,10 +5,13 @@ These tests exercise lesson orchestration, question generation,
 and answer processing using a real database.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import random
 import pytest
-from unittest.mock import AsyncMock
-from sqlalchemy import text
+from sqlalchemy import delete, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.words.config.constants import Direction, TestType as LessonTestType
 from src.words.config.settings import settings
@@ -28,30 +31,62 @@ from src.words.services.lesson import LessonService
 from src.words.services.validation import ValidationService
 
 
-async def _seed_profile_with_words(session):
-    user = User(user_id=30001, native_language="ru", interface_language="ru")
-    profile = LanguageProfile(user_id=30001, target_language="en", level=CEFRLevel.B1)
-    session.add_all([user, profile])
-    await session.commit()
+# Under `pytest -n auto --dist loadgroup` every test here runs on the worker
+# that built the module's seeded engine, instead of each worker seeding its own.
+pytestmark = pytest.mark.xdist_group(name="lesson_service_integration")
 
-    main_word = Word(
-        word="house",
-        language="en",
-        level="B1",
-        translations={"ru": ["дом", "жилище"]},
-        frequency_rank=1
-    )
-    distractors = [
-        Word(word="cat", language="en", level="B1", translations={"ru": ["кот"]}, frequency_rank=2),
-        Word(word="dog", language="en", level="B1", translations={"ru": ["собака"]}, frequency_rank=3),
-        Word(word="tree", language="en", level="B1", translations={"ru": ["дерево"]}, frequency_rank=4),
-    ]
-    session.add_all([main_word] + distractors)
-    await session.commit()
 
-    user_word = UserWord(profile_id=profile.profile_id, word_id=main_word.word_id)
-    session.add(user_word)
-    await session.commit()
+class _StubTranslator:
+    """Translation service stand-in returning a fixed LLM validation verdict."""
+
+    def __init__(self):
+        self.verdict = (True, "ok")
+
+    async def validate_answer_with_llm(self, *args, **kwargs):
+        return self.verdict
+
+
+# ValidationService only holds the translation service and a threshold, so one
+# instance serves every test; lesson_stack resets the verdict before each test.
+_TRANSLATION_SERVICE = _StubTranslator()
+_VALIDATION_SERVICE = ValidationService(_TRANSLATION_SERVICE)
+
+
+def _seed_profile_with_words(connection):
+    """Insert a profile with one vocabulary word and three distractors."""
+    with Session(bind=connection) as session:
+        user = User(user_id=30001, native_language="ru", interface_language="ru")
+        profile = LanguageProfile(user_id=30001, target_language="en", level=CEFRLevel.B1)
+
+        main_word = Word(
+            word="house",
+            language="en",
+            level="B1",
+            translations={"ru": ["дом", "жилище"]},
+            frequency_rank=1
+        )
+        distractors = [
+            Word(word="cat", language="en", level="B1", translations={"ru": ["кот"]}, frequency_rank=2),
+            Word(word="dog", language="en", level="B1", translations={"ru": ["собака"]}, frequency_rank=3),
+            Word(word="tree", language="en", level="B1", translations={"ru": ["дерево"]}, frequency_rank=4),
+        ]
+        session.add_all([user, profile, main_word] + distractors)
+        session.flush()
+
+        session.add(UserWord(profile_id=profile.profile_id, word_id=main_word.word_id))
+        session.flush()
+
+
+async def _load_profile_with_words(session):
+    """Load the rows written by ``_seed_profile_with_words``."""
+    user = await session.get(User, 30001)
+    result = await session.execute(
+        select(UserWord)
+        .join(LanguageProfile)
+        .where(LanguageProfile.user_id == user.user_id)
+    )
+    user_word = result.scalar_one()
+    profile = await session.get(LanguageProfile, user_word.profile_id)
 
     return user, profile, user_word
 
@@ -59,8 +94,6 @@ async def _seed_profile_with_words(session):
 async def _seed_profile_with_adaptive_words(session):
     user = User(user_id=40001, native_language="ru", interface_language="ru")
     profile = LanguageProfile(user_id=40001, target_language="en", level=CEFRLevel.B1)
-    session.add_all([user, profile])
-    await session.commit()
 
     overdue_word = Word(
         word="window",
@@ -83,8 +116,10 @@ async def _seed_profile_with_adaptive_words(session):
         translations={"ru": ["solntse"]},
         frequency_rank=3
     )
-    session.add_all([overdue_word, new_word, mastered_word])
-    await session.commit()
+    # One flush assigns the profile and word ids; the unit of work orders
+    # the inserts by foreign key.
+    session.add_all([user, profile, overdue_word, new_word, mastered_word])
+    await session.flush()
 
     now = datetime.now(timezone.utc)
     overdue_user_word = UserWord(
@@ -110,64 +145,173 @@ async def _seed_profile_with_adaptive_words(session):
     return profile, overdue_user_word, new_user_word, mastered_user_word
 
 
-@pytest.mark.asyncio
-async def test_lesson_flow_records_attempt_and_updates_stats(
-    integration_test_session, monkeypatch
-):
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
+def _assert_lesson_relationships_loaded(user_word):
+    """Fail if reading the relationships the lesson flow uses would lazy load."""
+    assert inspect(user_word).unloaded.isdisjoint({"word", "statistics", "profile"})
+    assert "user" not in inspect(user_word.profile).unloaded
+
+
+@pytest.fixture(scope="module")
+def integration_test_engine(seeded_integration_engine):
+    """
+    Create one engine for this module with the lesson word fixture pre-seeded.
+
+    Most tests here start from the same profile and words, so those rows are
+    written once into the engine's database instead of once per test. Tests
+    get them from ``seeded_lesson_profile``, and the SAVEPOINT rollback in
+    integration_test_session undoes whatever a test changes on top of them.
+
+    Args:
+        seeded_integration_engine: Seeded-engine helper from tests/conftest.py
+
+    Yields:
+        AsyncEngine: SQLAlchemy async engine for testing
+    """
+    with seeded_integration_engine(_seed_profile_with_words) as engine:
+        yield engine
+
+
+@dataclass
+class LessonStack:
+    """LessonService and the repositories it is wired to, sharing one session."""
 
+    session: AsyncSession
+    lesson_repo: LessonRepository
+    attempt_repo: LessonAttemptRepository
+    user_word_repo: UserWordRepository
+    word_repo: WordRepository
+    stats_repo: StatisticsRepository
+    translation_service: _StubTranslator
+    validation_service: ValidationService
+    service: LessonService
+
+
+@pytest.fixture
+def lesson_stack(integration_test_session):
+    """
+    Wire a LessonService to repositories bound to the integration session.
+
+    None of these objects hold per-test state beyond the session, so tests
+    share this arrangement instead of rebuilding it. The validation service
+    is the module-wide instance; its translation stub is reset here to accept
+    every answer, and tests needing another LLM verdict set
+    ``translation_service.verdict``.
+
+    Args:
+        integration_test_session: AsyncSession from integration_test_session
+
+    Returns:
+        LessonStack: Service, repositories and stub translation service
+    """
+    session = integration_test_session
     lesson_repo = LessonRepository(session)
     attempt_repo = LessonAttemptRepository(session)
     user_word_repo = UserWordRepository(session)
     word_repo = WordRepository(session)
     stats_repo = StatisticsRepository(session)
+    translation_service = _TRANSLATION_SERVICE
+    translation_service.verdict = (True, "ok")
+    validation_service = _VALIDATION_SERVICE
 
-    translation_service = AsyncMock()
-    translation_service.validate_answer_with_llm.return_value = (True, "ok")
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
+    return LessonStack(
+        session=session,
         lesson_repo=lesson_repo,
         attempt_repo=attempt_repo,
         user_word_repo=user_word_repo,
         word_repo=word_repo,
         stats_repo=stats_repo,
-        validation_service=validation_service
+        translation_service=translation_service,
+        validation_service=validation_service,
+        service=LessonService(
+            lesson_repo=lesson_repo,
+            attempt_repo=attempt_repo,
+            user_word_repo=user_word_repo,
+            word_repo=word_repo,
+            stats_repo=stats_repo,
+            validation_service=validation_service
+        )
     )
 
-    lesson = await lesson_service.get_or_create_active_lesson(
+
+@pytest.fixture
+async def seeded_lesson_profile(lesson_stack):
+    """
+    Load the profile and words seeded into this module's engine.
+
+    Args:
+        lesson_stack: LessonStack from the lesson_stack fixture
+
+    Returns:
+        tuple[User, LanguageProfile, UserWord]: Seeded user, profile and
+            vocabulary word, attached to the test's session
+    """
+    return await _load_profile_with_words(lesson_stack.session)
+
+
+class _FixedDirectionRng(random.Random):
+    """Random source whose ``choice`` always returns one direction."""
+
+    def __init__(self, direction):
+        super().__init__()
+        self.direction = direction
+
+    def choice(self, seq):
+        return self.direction
+
+
+@pytest.fixture
+def force_direction(lesson_stack):
+    """
+    Pin the direction LessonService picks for the next question.
+
+    Args:
+        lesson_stack: LessonStack from the lesson_stack fixture
+
+    Returns:
+        Callable[[str], None]: Gives the lesson service a random source whose
+            ``choice`` returns the given Direction value
+    """
+    def _force(direction):
+        lesson_stack.service.rng = _FixedDirectionRng(direction)
+
+    return _force
+
+
+@pytest.mark.asyncio
+async def test_lesson_flow_records_attempt_and_updates_stats(
+    lesson_stack, seeded_lesson_profile, force_direction
+):
+    _, profile, user_word = seeded_lesson_profile
+
+    lesson = await lesson_stack.service.get_or_create_active_lesson(
         profile_id=profile.profile_id,
         words_count=1
     )
 
-    # Force deterministic direction (native -> foreign)
-    import src.words.services.lesson as lesson_module
-    monkeypatch.setattr(
-        lesson_module.random,
-        "choice",
-        lambda _: Direction.NATIVE_TO_FOREIGN.value
-    )
+    force_direction(Direction.NATIVE_TO_FOREIGN.value)
 
-    selected_words = await user_word_repo.get_user_words_for_lesson(profile.profile_id)
-    question = await lesson_service.generate_next_question(lesson, selected_words)
+    selected_words = await lesson_stack.user_word_repo.get_user_words_for_lesson(profile.profile_id)
+    for selected in selected_words:
+        _assert_lesson_relationships_loaded(selected)
+
+    question = await lesson_stack.service.generate_next_question(lesson, selected_words)
     assert question is not None
     assert question.test_type == LessonTestType.MULTIPLE_CHOICE.value
     assert question.options is not None
     assert question.expected_answer in question.options
 
-    await lesson_service.process_answer(
+    await lesson_stack.service.process_answer(
         lesson_id=lesson.lesson_id,
         question=question,
         user_answer=question.expected_answer
     )
 
-    attempts = await attempt_repo.get_lesson_attempts(lesson.lesson_id)
+    attempts = await lesson_stack.attempt_repo.get_lesson_attempts(lesson.lesson_id)
     assert len(attempts) == 1
     assert attempts[0].is_correct is True
 
     # Stats updated
-    stats = await stats_repo.get_or_create_stat(
+    stats = await lesson_stack.stats_repo.get_or_create_stat(
         user_word_id=user_word.user_word_id,
         direction=question.direction,
         test_type=question.test_type
@@ -177,101 +321,75 @@ async def test_lesson_flow_records_attempt_and_updates_stats(
     assert stats.total_correct == 1
 
     # Lesson counters updated
-    refreshed_lesson = await lesson_repo.get_by_id(lesson.lesson_id)
+    refreshed_lesson = await lesson_stack.lesson_repo.get_by_id(lesson.lesson_id)
     assert refreshed_lesson.correct_answers == 1
     assert refreshed_lesson.incorrect_answers == 0
 
     # User word status progresses from NEW -> LEARNING
-    refreshed_user_word = await user_word_repo.get_by_id_with_details(user_word.user_word_id)
+    refreshed_user_word = await lesson_stack.user_word_repo.get_by_id_with_details(user_word.user_word_id)
+    _assert_lesson_relationships_loaded(refreshed_user_word)
     assert refreshed_user_word.status == WordStatusEnum.LEARNING
     assert refreshed_user_word.last_reviewed_at is not None
 
 
+@pytest.mark.parametrize(
+    "correct_streak,direction,expected_type",
+    [
+        (0, Direction.NATIVE_TO_FOREIGN.value, LessonTestType.MULTIPLE_CHOICE.value),
+        (
+            settings.choice_to_input_threshold,
+            Direction.FOREIGN_TO_NATIVE.value,
+            LessonTestType.INPUT.value,
+        ),
+    ],
+    ids=["below_threshold", "at_threshold"],
+)
 @pytest.mark.asyncio
-async def test_question_switches_to_input_after_threshold(
-    integration_test_session, monkeypatch
+async def test_question_type_follows_choice_threshold(
+    lesson_stack, seeded_lesson_profile, force_direction,
+    correct_streak, direction, expected_type
 ):
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
-
-    # Add statistics to trigger input mode
-    stat = WordStatistics(
-        user_word_id=user_word.user_word_id,
-        direction=Direction.NATIVE_TO_FOREIGN.value,
-        test_type=LessonTestType.MULTIPLE_CHOICE.value,
-        correct_count=settings.choice_to_input_threshold,
-        total_attempts=settings.choice_to_input_threshold
-    )
-    session.add(stat)
-    await session.commit()
-
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
-
-    translation_service = AsyncMock()
-    translation_service.validate_answer_with_llm.return_value = (True, "ok")
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
-    )
-
-    lesson = await lesson_service.get_or_create_active_lesson(
+    """Test multiple choice switches to input once the choice streak hits the threshold."""
+    session = lesson_stack.session
+    _, profile, user_word = seeded_lesson_profile
+
+    if correct_streak:
+        session.add(WordStatistics(
+            user_word_id=user_word.user_word_id,
+            direction=Direction.NATIVE_TO_FOREIGN.value,
+            test_type=LessonTestType.MULTIPLE_CHOICE.value,
+            correct_count=correct_streak,
+            total_attempts=correct_streak
+        ))
+        await session.flush()
+
+    lesson = await lesson_stack.service.get_or_create_active_lesson(
         profile_id=profile.profile_id,
         words_count=1
     )
 
-    import src.words.services.lesson as lesson_module
-    monkeypatch.setattr(
-        lesson_module.random,
-        "choice",
-        lambda _: Direction.FOREIGN_TO_NATIVE.value
-    )
+    force_direction(direction)
 
-    selected_words = await user_word_repo.get_user_words_for_lesson(profile.profile_id)
-    question = await lesson_service.generate_next_question(lesson, selected_words)
+    selected_words = await lesson_stack.user_word_repo.get_user_words_for_lesson(profile.profile_id)
+    question = await lesson_stack.service.generate_next_question(lesson, selected_words)
 
     assert question is not None
-    assert question.test_type == LessonTestType.INPUT.value
-    assert question.options is None
+    assert question.test_type == expected_type
+    if expected_type == LessonTestType.INPUT.value:
+        assert question.options is None
+    else:
+        assert question.expected_answer in question.options
 
 
 @pytest.mark.asyncio
 async def test_get_words_for_lesson_prioritizes_overdue_and_excludes_mastered(
-    integration_test_session
+    lesson_stack
 ):
-    session = integration_test_session
     profile, overdue_word, new_word, mastered_word = (
-        await _seed_profile_with_adaptive_words(session)
-    )
-
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
-
-    translation_service = AsyncMock()
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
+        await _seed_profile_with_adaptive_words(lesson_stack.session)
     )
 
-    selected = await lesson_service.get_words_for_lesson(
+    selected = await lesson_stack.service.get_words_for_lesson(
         profile_id=profile.profile_id,
         count=2
     )
@@ -285,98 +403,67 @@ async def test_get_words_for_lesson_prioritizes_overdue_and_excludes_mastered(
 
 @pytest.mark.asyncio
 async def test_get_words_for_lesson_backfills_from_frequency_words(
-    integration_test_session
+    lesson_stack
 ):
-    session = integration_test_session
+    session = lesson_stack.session
     user = User(user_id=41001, native_language="ru", interface_language="ru")
-    profile = LanguageProfile(user_id=41001, target_language="en", level=CEFRLevel.B1)
+    # B2, unlike the module's shared B1 seed, so the frequency list holds
+    # only the words created here.
+    profile = LanguageProfile(user_id=41001, target_language="en", level=CEFRLevel.B2)
     session.add_all([user, profile])
-    await session.commit()
+    await session.flush()
 
     words = [
-        Word(word="alpha", language="en", level="B1", frequency_rank=1, translations={"ru": ["альфа"]}),
-        Word(word="beta", language="en", level="B1", frequency_rank=2, translations={"ru": ["бета"]}),
-        Word(word="gamma", language="en", level="B1", frequency_rank=3, translations={"ru": ["гамма"]}),
+        Word(word="alpha", language="en", level="B2", frequency_rank=1, translations={"ru": ["альфа"]}),
+        Word(word="beta", language="en", level="B2", frequency_rank=2, translations={"ru": ["бета"]}),
+        Word(word="gamma", language="en", level="B2", frequency_rank=3, translations={"ru": ["гамма"]}),
     ]
     session.add_all(words)
-    await session.commit()
+    await session.flush()
 
     # User initially has only one word in personal vocabulary.
     session.add(UserWord(profile_id=profile.profile_id, word_id=words[0].word_id))
     await session.commit()
 
-    lesson_service = LessonService(
-        lesson_repo=LessonRepository(session),
-        attempt_repo=LessonAttemptRepository(session),
-        user_word_repo=UserWordRepository(session),
-        word_repo=WordRepository(session),
-        stats_repo=StatisticsRepository(session),
-        validation_service=ValidationService(AsyncMock()),
-    )
-
-    selected = await lesson_service.get_words_for_lesson(
+    selected = await lesson_stack.service.get_words_for_lesson(
         profile_id=profile.profile_id,
         count=3,
         target_language="en",
-        level="B1",
+        level="B2",
     )
     assert len(selected) == 3
 
-    all_user_words = await lesson_service.user_word_repo.get_user_vocabulary(profile.profile_id)
-    assert len(all_user_words) == 3
+    all_user_words = await lesson_stack.user_word_repo.get_user_vocabulary(profile.profile_id)
+    assert sorted(user_word.word.word for user_word in all_user_words) == ["alpha", "beta", "gamma"]
 
 
 @pytest.mark.asyncio
 async def test_process_answer_updates_spaced_repetition_and_status(
-    integration_test_session, monkeypatch
+    lesson_stack, seeded_lesson_profile, force_direction
 ):
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
-
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
+    _, profile, user_word = seeded_lesson_profile
 
-    translation_service = AsyncMock()
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
-    )
-
-    lesson = await lesson_service.get_or_create_active_lesson(
+    lesson = await lesson_stack.service.get_or_create_active_lesson(
         profile_id=profile.profile_id,
         words_count=1
     )
 
-    import src.words.services.lesson as lesson_module
-    monkeypatch.setattr(
-        lesson_module.random,
-        "choice",
-        lambda _: Direction.NATIVE_TO_FOREIGN.value
-    )
+    force_direction(Direction.NATIVE_TO_FOREIGN.value)
 
-    selected_words = await user_word_repo.get_user_words_for_lesson(profile.profile_id)
-    question = await lesson_service.generate_next_question(lesson, selected_words)
+    selected_words = await lesson_stack.user_word_repo.get_user_words_for_lesson(profile.profile_id)
+    question = await lesson_stack.service.generate_next_question(lesson, selected_words)
     assert question is not None
 
-    before = await user_word_repo.get_by_id_with_details(user_word.user_word_id)
+    before = await lesson_stack.user_word_repo.get_by_id_with_details(user_word.user_word_id)
     previous_ef = before.easiness_factor
 
-    await lesson_service.process_answer(
+    await lesson_stack.service.process_answer(
         lesson_id=lesson.lesson_id,
         question=question,
         user_answer=question.expected_answer
     )
 
-    refreshed = await user_word_repo.get_by_id_with_details(user_word.user_word_id)
+    refreshed = await lesson_stack.user_word_repo.get_by_id_with_details(user_word.user_word_id)
     assert refreshed.review_interval == 1
     assert refreshed.next_review_at is not None
     assert refreshed.next_review_at.tzinfo is not None
@@ -386,154 +473,83 @@ async def test_process_answer_updates_spaced_repetition_and_status(
 
 @pytest.mark.asyncio
 async def test_process_answer_incorrect_resets_interval_and_decreases_ef(
-    integration_test_session, monkeypatch
+    lesson_stack, seeded_lesson_profile, force_direction
 ):
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
+    session = lesson_stack.session
+    _, profile, user_word = seeded_lesson_profile
 
     user_word.review_interval = 6
     user_word.easiness_factor = 2.5
     await session.commit()
 
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
-
-    translation_service = AsyncMock()
-    translation_service.validate_answer_with_llm.return_value = (False, "no")
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
-    )
+    lesson_stack.translation_service.verdict = (False, "no")
 
-    lesson = await lesson_service.get_or_create_active_lesson(
+    lesson = await lesson_stack.service.get_or_create_active_lesson(
         profile_id=profile.profile_id,
         words_count=1
     )
 
-    import src.words.services.lesson as lesson_module
-    monkeypatch.setattr(
-        lesson_module.random,
-        "choice",
-        lambda _: Direction.NATIVE_TO_FOREIGN.value
-    )
+    force_direction(Direction.NATIVE_TO_FOREIGN.value)
 
-    selected_words = await user_word_repo.get_user_words_for_lesson(profile.profile_id)
-    question = await lesson_service.generate_next_question(lesson, selected_words)
+    selected_words = await lesson_stack.user_word_repo.get_user_words_for_lesson(profile.profile_id)
+    question = await lesson_stack.service.generate_next_question(lesson, selected_words)
     assert question is not None
 
-    await lesson_service.process_answer(
+    await lesson_stack.service.process_answer(
         lesson_id=lesson.lesson_id,
         question=question,
         user_answer="wrong-answer"
     )
 
-    refreshed = await user_word_repo.get_by_id_with_details(user_word.user_word_id)
+    refreshed = await lesson_stack.user_word_repo.get_by_id_with_details(user_word.user_word_id)
     assert refreshed.review_interval == 1
     assert refreshed.next_review_at is not None
     assert refreshed.easiness_factor < 2.5
     assert refreshed.easiness_factor >= 1.3
 
 
+@pytest.mark.parametrize("check", ["options_none", "fallback_input"])
 @pytest.mark.asyncio
-async def test_generate_options_returns_none_when_insufficient_distractors(
-    integration_test_session
-):
-    """Test that _generate_options returns None if < 2 options found."""
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
-
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
+async def test_no_distractors(lesson_stack, seeded_lesson_profile, force_direction, check):
+    """Test the lesson flow when no distractor words are available.
 
-    translation_service = AsyncMock()
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
-    )
+    _generate_options returns None when fewer than 2 options are found, and
+    the question type falls back to INPUT.
+    """
+    session = lesson_stack.session
+    _, profile, user_word = seeded_lesson_profile
 
     # Delete all distractor words from DB
-    await session.execute(text("DELETE FROM words WHERE word != 'house'"))
+    await session.execute(delete(Word).where(Word.word_id != user_word.word_id))
     await session.commit()
 
-    detailed = await user_word_repo.get_by_id_with_details(user_word.user_word_id)
-    word = detailed.word
-
-    options = await lesson_service._generate_options(
-        correct_answer="дом",
-        word=word,
-        direction=Direction.NATIVE_TO_FOREIGN.value,
-        native_lang="ru",
-        target_lang="en",
-        level="B1",
-        count=4
-    )
-
-    # Should return None (insufficient options)
-    assert options is None
-
-
-@pytest.mark.asyncio
-async def test_question_falls_back_to_input_when_no_distractors(
-    integration_test_session, monkeypatch
-):
-    """Test that question type falls back to INPUT when no distractors available."""
-    session = integration_test_session
-    _, profile, user_word = await _seed_profile_with_words(session)
-
-    # Delete all distractor words from DB
-    await session.execute(text("DELETE FROM words WHERE word != 'house'"))
-    await session.commit()
-
-    lesson_repo = LessonRepository(session)
-    attempt_repo = LessonAttemptRepository(session)
-    user_word_repo = UserWordRepository(session)
-    word_repo = WordRepository(session)
-    stats_repo = StatisticsRepository(session)
-
-    translation_service = AsyncMock()
-    validation_service = ValidationService(translation_service)
-
-    lesson_service = LessonService(
-        lesson_repo=lesson_repo,
-        attempt_repo=attempt_repo,
-        user_word_repo=user_word_repo,
-        word_repo=word_repo,
-        stats_repo=stats_repo,
-        validation_service=validation_service
-    )
-
-    lesson = await lesson_service.get_or_create_active_lesson(
+    if check == "options_none":
+        detailed = await lesson_stack.user_word_repo.get_by_id_with_details(user_word.user_word_id)
+        _assert_lesson_relationships_loaded(detailed)
+
+        options = await lesson_stack.service._generate_options(
+            correct_answer="дом",
+            word=detailed.word,
+            direction=Direction.NATIVE_TO_FOREIGN.value,
+            native_lang="ru",
+            target_lang="en",
+            level="B1",
+            count=4
+        )
+
+        # Should return None (insufficient options)
+        assert options is None
+        return
+
+    lesson = await lesson_stack.service.get_or_create_active_lesson(
         profile_id=profile.profile_id,
         words_count=1
     )
 
-    import src.words.services.lesson as lesson_module
-    monkeypatch.setattr(
-        lesson_module.random,
-        "choice",
-        lambda _: Direction.NATIVE_TO_FOREIGN.value
-    )
+    force_direction(Direction.NATIVE_TO_FOREIGN.value)
 
-    selected_words = await user_word_repo.get_user_words_for_lesson(profile.profile_id)
-    question = await lesson_service.generate_next_question(lesson, selected_words)
+    selected_words = await lesson_stack.user_word_repo.get_user_words_for_lesson(profile.profile_id)
+    question = await lesson_stack.service.generate_next_question(lesson, selected_words)
 
     assert question is not None
     # Should fallback to INPUT when no distractors
@@ -11,23 +11,75 @@ Tests cover:
 - Edge cases and error scenarios
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
+from src.words.services import translation as translation_module
 from src.words.services.translation import TranslationService
-from src.words.infrastructure.llm_client import LLMClient
-from src.words.repositories.cache import CacheRepository
+
+
+# LLM translation payloads shared by the parametrized cases; never mutated.
+_HELLO_TRANSLATION = {
+    "word": "hello",
+    "translations": ["привет", "здравствуй"],
+    "examples": [
+        {"source": "Hello, world!", "target": "Привет, мир!"}
+    ],
+    "word_forms": {"plural": "hellos"}
+}
+_PRIVET_TRANSLATION = {
+    "word": "привет",
+    "translations": ["hello", "hi"],
+    "examples": [
+        {"source": "Привет, мир!", "target": "Hello, world!"}
+    ],
+    "word_forms": {}
+}
+
+_NULL_LOGGER = SimpleNamespace(
+    debug=lambda *args, **kwargs: None,
+    info=lambda *args, **kwargs: None,
+    error=lambda *args, **kwargs: None,
+)
+
+
+@pytest.fixture(autouse=True)
+def _null_logger(monkeypatch):
+    """
+    Silence the translation service logger unless a test asserts on it.
+
+    Log calls go to a no-op namespace instead of the real handlers; tests
+    that check logging request ``mock_logger``, which replaces it again.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(translation_module, "logger", _NULL_LOGGER)
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """
+    Replace the translation service logger with a recording mock.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+
+    Returns:
+        MagicMock: Logger mock whose debug/info/error calls can be asserted
+    """
+    logger = MagicMock()
+    monkeypatch.setattr(translation_module, "logger", logger)
+    return logger
 
 
 class TestTranslationServiceInitialization:
     """Tests for TranslationService initialization."""
 
-    @pytest.mark.asyncio
-    async def test_translation_service_initialization(self):
+    async def test_translation_service_initialization(self, mock_llm_client, mock_cache_repo):
         """Test that TranslationService can be initialized with dependencies."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
         assert service.llm_client is mock_llm_client
@@ -37,112 +89,65 @@ class TestTranslationServiceInitialization:
 class TestTranslateWord:
     """Tests for translate_word method."""
 
-    @pytest.mark.asyncio
-    async def test_translate_word_cache_hit(self):
-        """Test that translate_word returns cached result when available."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache hit
-        cached_result = {
-            "word": "hello",
-            "translations": ["привет", "здравствуй"],
-            "examples": [
-                {"source": "Hello, world!", "target": "Привет, мир!"}
-            ],
-            "word_forms": {"plural": "hellos"}
-        }
-        mock_cache_repo.get_translation.return_value = cached_result
+    @pytest.mark.parametrize(
+        "word,source_lang,target_lang,cached,llm_result",
+        [
+            ("hello", "en", "ru", _HELLO_TRANSLATION, None),
+            ("hello", "en", "ru", None, _HELLO_TRANSLATION),
+            ("привет", "ru", "en", None, _PRIVET_TRANSLATION),
+        ],
+        ids=["cache_hit", "cache_miss", "cache_miss_other_language_pair"],
+    )
+    async def test_translate_word_cache_lookup(
+        self, mock_llm_client, mock_cache_repo, mock_logger,
+        word, source_lang, target_lang, cached, llm_result
+    ):
+        """Test that translate_word serves cache hits and calls the LLM and caches on misses."""
+        mock_cache_repo.get_translation.return_value = cached
+        mock_llm_client.translate_word.return_value = llm_result
 
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
-        with patch('src.words.services.translation.logger') as mock_logger:
-            result = await service.translate_word(
-                word="hello",
-                source_lang="en",
-                target_lang="ru"
-            )
+        result = await service.translate_word(
+            word=word,
+            source_lang=source_lang,
+            target_lang=target_lang
+        )
 
-            # Verify cache was checked
-            mock_cache_repo.get_translation.assert_called_once_with(
-                "hello", "en", "ru"
-            )
+        # Verify cache was checked for the requested language pair
+        mock_cache_repo.get_translation.assert_called_once_with(
+            word, source_lang, target_lang
+        )
 
-            # Verify LLM was NOT called
+        if cached is not None:
+            # Verify LLM was NOT called and the hit was logged
             mock_llm_client.translate_word.assert_not_called()
-
-            # Verify logger recorded cache hit
+            mock_cache_repo.set_translation.assert_not_called()
             mock_logger.debug.assert_called_once_with(
                 "translation_cache_hit",
-                word="hello",
-                source="en",
-                target="ru"
-            )
-
-            # Verify result
-            assert result == cached_result
-
-    @pytest.mark.asyncio
-    async def test_translate_word_cache_miss(self):
-        """Test that translate_word calls LLM and caches result on cache miss."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache miss
-        mock_cache_repo.get_translation.return_value = None
-
-        # Mock LLM result
-        llm_result = {
-            "word": "hello",
-            "translations": ["привет", "здравствуй"],
-            "examples": [
-                {"source": "Hello, world!", "target": "Привет, мир!"}
-            ],
-            "word_forms": {"plural": "hellos"}
-        }
-        mock_llm_client.translate_word.return_value = llm_result
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        with patch('src.words.services.translation.logger') as mock_logger:
-            result = await service.translate_word(
-                word="hello",
-                source_lang="en",
-                target_lang="ru"
-            )
-
-            # Verify cache was checked
-            mock_cache_repo.get_translation.assert_called_once_with(
-                "hello", "en", "ru"
+                word=word,
+                source=source_lang,
+                target=target_lang
             )
-
-            # Verify LLM was called
+            assert result == cached
+        else:
+            # Verify LLM was called, its result cached and the call logged
             mock_llm_client.translate_word.assert_called_once_with(
-                "hello", "en", "ru"
+                word, source_lang, target_lang
             )
-
-            # Verify result was cached
             mock_cache_repo.set_translation.assert_called_once_with(
-                "hello", "en", "ru", llm_result
+                word, source_lang, target_lang, llm_result
             )
-
-            # Verify logger recorded LLM call
             mock_logger.info.assert_called_once_with(
                 "translation_llm_call",
-                word="hello",
-                source="en",
-                target="ru"
+                word=word,
+                source=source_lang,
+                target=target_lang
             )
-
-            # Verify result
             assert result == llm_result
 
-    @pytest.mark.asyncio
-    async def test_translate_word_llm_error(self):
+    async def test_translate_word_llm_error(self, mock_llm_client, mock_cache_repo, mock_logger):
         """Test that translate_word handles LLM errors and logs them."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         # Mock cache miss
         mock_cache_repo.get_translation.return_value = None
 
@@ -151,30 +156,25 @@ class TestTranslateWord:
 
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
-        with patch('src.words.services.translation.logger') as mock_logger:
-            with pytest.raises(Exception, match="API error"):
-                await service.translate_word(
-                    word="hello",
-                    source_lang="en",
-                    target_lang="ru"
-                )
-
-            # Verify error was logged
-            mock_logger.error.assert_called_once_with(
-                "translation_failed",
+        with pytest.raises(Exception, match="API error"):
+            await service.translate_word(
                 word="hello",
-                error="API error"
+                source_lang="en",
+                target_lang="ru"
             )
 
-            # Verify result was NOT cached
-            mock_cache_repo.set_translation.assert_not_called()
+        # Verify error was logged
+        mock_logger.error.assert_called_once_with(
+            "translation_failed",
+            word="hello",
+            error="API error"
+        )
 
-    @pytest.mark.asyncio
-    async def test_translate_word_does_not_cache_on_error(self):
-        """Test that translate_word does not cache results when LLM fails."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
+        # Verify result was NOT cached
+        mock_cache_repo.set_translation.assert_not_called()
 
+    async def test_translate_word_does_not_cache_on_error(self, mock_llm_client, mock_cache_repo):
+        """Test that translate_word does not cache results when LLM fails."""
         # Mock cache miss
         mock_cache_repo.get_translation.return_value = None
 
@@ -193,153 +193,92 @@ class TestTranslateWord:
         # Verify set_translation was NOT called
         mock_cache_repo.set_translation.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_translate_word_with_different_languages(self):
-        """Test translate_word with different language pairs."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache miss
-        mock_cache_repo.get_translation.return_value = None
-
-        # Mock LLM result
-        llm_result = {
-            "word": "привет",
-            "translations": ["hello", "hi"],
-            "examples": [
-                {"source": "Привет, мир!", "target": "Hello, world!"}
-            ],
-            "word_forms": {}
-        }
-        mock_llm_client.translate_word.return_value = llm_result
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        result = await service.translate_word(
-            word="привет",
-            source_lang="ru",
-            target_lang="en"
-        )
-
-        # Verify correct language pair was used
-        mock_llm_client.translate_word.assert_called_once_with(
-            "привет", "ru", "en"
-        )
-        mock_cache_repo.get_translation.assert_called_once_with(
-            "привет", "ru", "en"
-        )
-
-        assert result == llm_result
-
 
 class TestValidateAnswerWithLLM:
     """Tests for validate_answer_with_llm method."""
 
-    @pytest.mark.asyncio
-    async def test_validate_answer_cache_hit(self):
-        """Test that validate_answer returns cached result when available."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache hit
-        cached_result = (True, "Правильно!")
-        mock_cache_repo.get_validation.return_value = cached_result
+    @pytest.mark.parametrize(
+        "question,expected,user_answer,source_lang,target_lang,word_id,direction,cached,llm_result",
+        [
+            (
+                "hello", "привет", "привет", "en", "ru", 123, "forward",
+                (True, "Правильно!"),
+                None,
+            ),
+            (
+                "hello", "привет", "превет", "en", "ru", 123, "forward",
+                None,
+                {"is_correct": False, "comment": "Неправильно. Правильный ответ: привет"},
+            ),
+            (
+                "hello", "привет", "привет", "en", "ru", 123, "forward",
+                None,
+                {"is_correct": True, "comment": "Правильно! Отличная работа!"},
+            ),
+            (
+                "привет", "hello", "hello", "ru", "en", 456, "backward",
+                None,
+                {"is_correct": True, "comment": "Correct!"},
+            ),
+        ],
+        ids=["cache_hit", "cache_miss_incorrect", "cache_miss_correct", "cache_miss_backward"],
+    )
+    async def test_validate_answer_cache_lookup(
+        self, mock_llm_client, mock_cache_repo, mock_logger,
+        question, expected, user_answer, source_lang, target_lang, word_id, direction,
+        cached, llm_result
+    ):
+        """Test that validate_answer serves cache hits and calls the LLM and caches on misses."""
+        mock_cache_repo.get_validation.return_value = cached
+        mock_llm_client.validate_answer.return_value = llm_result
 
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
-        with patch('src.words.services.translation.logger') as mock_logger:
-            is_correct, comment = await service.validate_answer_with_llm(
-                question="hello",
-                expected="привет",
-                user_answer="привет",
-                source_lang="en",
-                target_lang="ru",
-                word_id=123,
-                direction="forward"
-            )
+        is_correct, comment = await service.validate_answer_with_llm(
+            question=question,
+            expected=expected,
+            user_answer=user_answer,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            word_id=word_id,
+            direction=direction
+        )
 
-            # Verify cache was checked
-            mock_cache_repo.get_validation.assert_called_once_with(
-                123, "forward", "привет", "привет"
-            )
+        # Verify cache was checked for this word and direction
+        mock_cache_repo.get_validation.assert_called_once_with(
+            word_id, direction, expected, user_answer
+        )
 
-            # Verify LLM was NOT called
+        if cached is not None:
+            # Verify LLM was NOT called and the hit was logged
             mock_llm_client.validate_answer.assert_not_called()
-
-            # Verify logger recorded cache hit
+            mock_cache_repo.set_validation.assert_not_called()
             mock_logger.debug.assert_called_once_with(
                 "validation_cache_hit",
-                word_id=123,
-                user_answer="привет"
+                word_id=word_id,
+                user_answer=user_answer
             )
-
-            # Verify result
-            assert is_correct is True
-            assert comment == "Правильно!"
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_cache_miss(self):
-        """Test that validate_answer calls LLM and caches result on cache miss."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache miss
-        mock_cache_repo.get_validation.return_value = None
-
-        # Mock LLM result
-        llm_result = {
-            "is_correct": False,
-            "comment": "Неправильно. Правильный ответ: привет"
-        }
-        mock_llm_client.validate_answer.return_value = llm_result
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        with patch('src.words.services.translation.logger') as mock_logger:
-            is_correct, comment = await service.validate_answer_with_llm(
-                question="hello",
-                expected="привет",
-                user_answer="превет",
-                source_lang="en",
-                target_lang="ru",
-                word_id=123,
-                direction="forward"
-            )
-
-            # Verify cache was checked
-            mock_cache_repo.get_validation.assert_called_once_with(
-                123, "forward", "привет", "превет"
-            )
-
-            # Verify LLM was called
+            assert (is_correct, comment) == cached
+        else:
+            # Verify LLM was called, its verdict cached and the call logged
             mock_llm_client.validate_answer.assert_called_once_with(
-                "hello", "привет", "превет", "en", "ru"
+                question, expected, user_answer, source_lang, target_lang
             )
-
-            # Verify result was cached
             mock_cache_repo.set_validation.assert_called_once_with(
-                123, "forward", "привет", "превет", False,
-                "Неправильно. Правильный ответ: привет"
+                word_id, direction, expected, user_answer,
+                llm_result["is_correct"], llm_result["comment"]
             )
-
-            # Verify logger recorded LLM call
             mock_logger.info.assert_called_once_with(
                 "validation_llm_call",
-                word_id=123,
-                expected="привет",
-                user_answer="превет"
+                word_id=word_id,
+                expected=expected,
+                user_answer=user_answer
             )
+            assert is_correct is llm_result["is_correct"]
+            assert comment == llm_result["comment"]
 
-            # Verify result
-            assert is_correct is False
-            assert comment == "Неправильно. Правильный ответ: привет"
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_llm_error_fallback(self):
+    async def test_validate_answer_llm_error_fallback(self, mock_llm_client, mock_cache_repo, mock_logger):
         """Test that validate_answer falls back gracefully on LLM error."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         # Mock cache miss
         mock_cache_repo.get_validation.return_value = None
 
@@ -348,45 +287,6 @@ class TestValidateAnswerWithLLM:
 
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
-        with patch('src.words.services.translation.logger') as mock_logger:
-            is_correct, comment = await service.validate_answer_with_llm(
-                question="hello",
-                expected="привет",
-                user_answer="превет",
-                source_lang="en",
-                target_lang="ru",
-                word_id=123,
-                direction="forward"
-            )
-
-            # Verify error was logged
-            mock_logger.error.assert_called_once_with(
-                "validation_failed",
-                word_id=123,
-                error="API error"
-            )
-
-            # Verify fallback behavior: (False, error message)
-            assert is_correct is False
-            assert comment == "Validation service unavailable. Please try again."
-
-            # Verify result was NOT cached
-            mock_cache_repo.set_validation.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_does_not_cache_on_error(self):
-        """Test that validate_answer does not cache results when LLM fails."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache miss
-        mock_cache_repo.get_validation.return_value = None
-
-        # Mock LLM error
-        mock_llm_client.validate_answer.side_effect = ValueError("Invalid answer")
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
         is_correct, comment = await service.validate_answer_with_llm(
             question="hello",
             expected="привет",
@@ -397,96 +297,53 @@ class TestValidateAnswerWithLLM:
             direction="forward"
         )
 
-        # Verify set_validation was NOT called
-        mock_cache_repo.set_validation.assert_not_called()
+        # Verify error was logged
+        mock_logger.error.assert_called_once_with(
+            "validation_failed",
+            word_id=123,
+            error="API error"
+        )
 
-        # Verify fallback
+        # Verify fallback behavior: (False, error message)
         assert is_correct is False
-        assert "unavailable" in comment.lower()
+        assert comment == "Validation service unavailable. Please try again."
 
-    @pytest.mark.asyncio
-    async def test_validate_answer_with_correct_answer(self):
-        """Test validate_answer with a correct answer."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
+        # Verify result was NOT cached
+        mock_cache_repo.set_validation.assert_not_called()
 
+    async def test_validate_answer_does_not_cache_on_error(self, mock_llm_client, mock_cache_repo):
+        """Test that validate_answer does not cache results when LLM fails."""
         # Mock cache miss
         mock_cache_repo.get_validation.return_value = None
 
-        # Mock LLM result for correct answer
-        llm_result = {
-            "is_correct": True,
-            "comment": "Правильно! Отличная работа!"
-        }
-        mock_llm_client.validate_answer.return_value = llm_result
+        # Mock LLM error
+        mock_llm_client.validate_answer.side_effect = ValueError("Invalid answer")
 
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
         is_correct, comment = await service.validate_answer_with_llm(
             question="hello",
             expected="привет",
-            user_answer="привет",
+            user_answer="превет",
             source_lang="en",
             target_lang="ru",
             word_id=123,
             direction="forward"
         )
 
-        # Verify result
-        assert is_correct is True
-        assert "Правильно" in comment
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_with_different_direction(self):
-        """Test validate_answer with backward direction."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        # Mock cache miss
-        mock_cache_repo.get_validation.return_value = None
-
-        # Mock LLM result
-        llm_result = {
-            "is_correct": True,
-            "comment": "Correct!"
-        }
-        mock_llm_client.validate_answer.return_value = llm_result
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        is_correct, comment = await service.validate_answer_with_llm(
-            question="привет",
-            expected="hello",
-            user_answer="hello",
-            source_lang="ru",
-            target_lang="en",
-            word_id=456,
-            direction="backward"
-        )
-
-        # Verify correct direction was used
-        mock_cache_repo.get_validation.assert_called_once_with(
-            456, "backward", "hello", "hello"
-        )
-
-        # Verify result was cached with correct direction
-        mock_cache_repo.set_validation.assert_called_once()
-        call_args = mock_cache_repo.set_validation.call_args[0]
-        assert call_args[0] == 456  # word_id
-        assert call_args[1] == "backward"  # direction
+        # Verify set_validation was NOT called
+        mock_cache_repo.set_validation.assert_not_called()
 
-        assert is_correct is True
+        # Verify fallback
+        assert is_correct is False
+        assert "unavailable" in comment.lower()
 
 
 class TestTranslationServiceIntegration:
     """Integration tests for TranslationService with mocked dependencies."""
 
-    @pytest.mark.asyncio
-    async def test_full_translation_workflow(self):
+    async def test_full_translation_workflow(self, mock_llm_client, mock_cache_repo):
         """Test complete translation workflow from cache miss to cache hit."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         # First call: cache miss
         mock_cache_repo.get_translation.return_value = None
 
@@ -527,12 +384,8 @@ class TestTranslationServiceIntegration:
         # LLM should not be called again
         assert mock_llm_client.translate_word.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_full_validation_workflow(self):
+    async def test_full_validation_workflow(self, mock_llm_client, mock_cache_repo):
         """Test complete validation workflow from cache miss to cache hit."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         # First call: cache miss
         mock_cache_repo.get_validation.return_value = None
 
@@ -579,12 +432,8 @@ class TestTranslationServiceIntegration:
         # LLM should not be called again
         assert mock_llm_client.validate_answer.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_multiple_validation_attempts_same_word(self):
+    async def test_multiple_validation_attempts_same_word(self, mock_llm_client, mock_cache_repo):
         """Test multiple validation attempts for the same word with different answers."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         service = TranslationService(mock_llm_client, mock_cache_repo)
 
         # First attempt: wrong answer
@@ -632,62 +481,8 @@ class TestTranslationServiceIntegration:
 class TestTranslationServiceEdgeCases:
     """Tests for edge cases and error scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_translate_word_with_empty_cache_repo_response(self):
-        """Test translate_word when cache returns None explicitly."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        mock_cache_repo.get_translation.return_value = None
-        mock_llm_client.translate_word.return_value = {
-            "word": "hello",
-            "translations": ["привет"],
-            "examples": [],
-            "word_forms": {}
-        }
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        result = await service.translate_word("hello", "en", "ru")
-
-        # Should call LLM when cache returns None
-        mock_llm_client.translate_word.assert_called_once()
-        assert result["word"] == "hello"
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_with_empty_cache_repo_response(self):
-        """Test validate_answer when cache returns None explicitly."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
-        mock_cache_repo.get_validation.return_value = None
-        mock_llm_client.validate_answer.return_value = {
-            "is_correct": True,
-            "comment": "Good!"
-        }
-
-        service = TranslationService(mock_llm_client, mock_cache_repo)
-
-        is_correct, comment = await service.validate_answer_with_llm(
-            question="hello",
-            expected="привет",
-            user_answer="привет",
-            source_lang="en",
-            target_lang="ru",
-            word_id=123,
-            direction="forward"
-        )
-
-        # Should call LLM when cache returns None
-        mock_llm_client.validate_answer.assert_called_once()
-        assert is_correct is True
-
-    @pytest.mark.asyncio
-    async def test_validate_answer_fallback_message_format(self):
+    async def test_validate_answer_fallback_message_format(self, mock_llm_client, mock_cache_repo):
         """Test that validation fallback message is user-friendly."""
-        mock_llm_client = AsyncMock(spec=LLMClient)
-        mock_cache_repo = AsyncMock(spec=CacheRepository)
-
         mock_cache_repo.get_validation.return_value = None
         mock_llm_client.validate_answer.side_effect = Exception("Network error")
 